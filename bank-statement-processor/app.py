@@ -2,12 +2,14 @@
 Main Streamlit application for Bank Statement Processor
 """
 
+import hashlib
+
 import streamlit as st
 import pandas as pd
 from io import BytesIO
 from typing import Optional
 
-from parsers import ICICIParser, AXISParser, JanaParser, RBLParser
+import parsers
 from config import SUPPORTED_BANKS, SUPPORTED_FILE_TYPES
 
 
@@ -54,10 +56,11 @@ def main():
     
     with col1:
         st.subheader(f"📁 Upload {bank_option} Statement")
-        uploaded_file = st.file_uploader(
-            f"Choose Excel file for {bank_option}",
+        uploaded_files = st.file_uploader(
+            f"Choose Excel file(s) for {bank_option}",
             type=SUPPORTED_FILE_TYPES,
-            help=f"Upload your {bank_option} bank statement in Excel format (.xlsx or .xls)"
+            accept_multiple_files=True,
+            help=f"Upload one or more {bank_option} bank statements in Excel format (.xlsx or .xls)"
         )
     
     with col2:
@@ -69,22 +72,28 @@ def main():
         4. **Download** the processed file
         """)
     
-    # Process file if uploaded
-    if uploaded_file:
+    # Process uploaded files one by one. Each file's result is cached
+    # on its content hash, so a failure in one file doesn't waste the
+    # work done for the others, and reruns only parse new uploads.
+    for position, uploaded_file in enumerate(uploaded_files):
+        if len(uploaded_files) > 1:
+            st.markdown(f"## 📄 {uploaded_file.name}")
         try:
             with st.spinner(f"Processing {bank_option} statement..."):
-                # Create appropriate parser
-                parser = create_parser(bank_option)
-                
-                # Process the file
-                df = parser.process_file(uploaded_file)
-                
+                # Read the upload once; everything downstream (hash,
+                # cache, parser) works off this single bytes object
+                raw = uploaded_file.getvalue()
+                file_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+                # Process the file (cached on bank + file content hash)
+                df = process_uploaded_file(bank_option, uploaded_file.name, file_hash, raw)
+
                 if not df.empty:
                     st.success("✅ File processed successfully!")
-                    display_results(df, bank_option, uploaded_file.name)
+                    display_results(df, bank_option, uploaded_file.name, position)
                 else:
                     st.warning("⚠️ No data found in the uploaded file. Please check the file format.")
-                    
+
         except Exception as e:
             st.error(f"❌ Error processing file: {str(e)}")
             st.markdown("**Detailed Error Information:**")
@@ -97,44 +106,134 @@ def main():
             st.markdown("- For ICICI Yearly: Ensure file has 10 columns")
 
 
+@st.cache_resource
+def get_parser(bank_option: str):
+    """Create a parser once per bank and reuse it across Streamlit reruns"""
+    return create_parser(bank_option)
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def process_uploaded_file(bank_option: str, file_name: str, file_hash: str,
+                          _file_bytes: bytes) -> pd.DataFrame:
+    """Process an uploaded statement, cached on bank selection and file hash
+
+    The raw bytes are underscore-prefixed so Streamlit keys the cache on
+    the cheap blake2b digest instead of re-hashing the whole upload.
+    persist="disk" keeps processed frames across app restarts, so
+    re-uploading the same statement in a new session skips parsing too.
+    """
+    buffer = BytesIO(_file_bytes)
+    buffer.name = file_name  # keep the extension visible for engine detection
+    return get_parser(bank_option).process_file(buffer)
+
+
+# Maximum rows rendered in the on-screen preview table
+PREVIEW_ROWS = 1000
+
+# Amount columns (varies by bank) converted to numeric for display/export
+AMOUNT_COLUMNS = [
+    "Withdrawal Amt (INR)", "Deposit Amt (INR)", "Balance (INR)",
+    "Amount(INR)", "Balance(INR)", "Available Balance(INR)", "Transaction Amount(INR)"
+]
+
+# Parser factories keyed by bank selection. Attribute access on the
+# parsers package is lazy, so only the selected bank's module loads.
+_PARSERS = {
+    "ICICI Yearly": lambda: parsers.ICICIParser(is_monthly=False),
+    "ICICI Monthly": lambda: parsers.ICICIParser(is_monthly=True),
+    "AXIS": lambda: parsers.AXISParser(),
+    "Jana Bank": lambda: parsers.JanaParser(),
+    "RBL Bank": lambda: parsers.RBLParser(),
+}
+
+
 def create_parser(bank_option: str):
     """Create appropriate parser based on bank selection"""
-    if bank_option == "ICICI Yearly":
-        return ICICIParser(is_monthly=False)
-    elif bank_option == "ICICI Monthly":
-        return ICICIParser(is_monthly=True)
-    elif bank_option == "AXIS":
-        return AXISParser()
-    elif bank_option == "Jana Bank":
-        return JanaParser()
-    elif bank_option == "RBL Bank":
-        return RBLParser()
-    else:
+    try:
+        return _PARSERS[bank_option]()
+    except KeyError:
         raise ValueError(f"Unsupported bank: {bank_option}")
 
 
-def display_results(df: pd.DataFrame, bank_option: str, filename: str):
-    """Display processed results and download option"""
-    
+@st.cache_data(show_spinner=False)
+def _to_excel_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a result frame to Excel bytes, cached across reruns"""
+    # No constant_memory here: to_excel writes cell data column by
+    # column, and xlsxwriter's constant-memory mode flushes each row as
+    # soon as a later one is touched, silently dropping every column
+    # after the first. Plain xlsxwriter is still faster than openpyxl.
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="Processed_Statement")
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a result frame to CSV bytes, cached across reruns"""
+    return df.to_csv(index=False).encode()
+
+
+@st.cache_data(show_spinner=False)
+def _to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a result frame to Parquet bytes, cached across reruns"""
+    buffer = BytesIO()
+    df.to_parquet(buffer, engine="pyarrow", compression="zstd")
+    return buffer.getvalue()
+
+
+def display_results(df: pd.DataFrame, bank_option: str, filename: str, position: int):
+    """Display processed results and download option
+
+    position is the file's index in the upload list; it keeps widget
+    keys unique even when two uploads share a filename.
+    """
+
+    # Compact dtypes before rendering and serializing: the label columns
+    # hold tiny vocabularies, so category dtype stores int codes plus a
+    # dictionary (smaller Arrow payload, faster value_counts), and the
+    # amount columns become real numbers instead of strings. float64 is
+    # kept over float32 so large INR balances don't lose paise precision.
+    for col in ("Debit/Credit", "Payment Category"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in AMOUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(
+                df[col].astype(str).str.replace(",", "", regex=False),
+                errors="coerce"
+            )
+
     # Display processed data
     st.subheader("📊 Processed Data")
     
-    # Show summary statistics
+    # Show summary statistics. One value_counts pass covers both the
+    # credit and debit metrics instead of two filtered copies.
+    debit_credit_counts = df["Debit/Credit"].value_counts()
+
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("Total Transactions", len(df))
     with col2:
-        credit_count = len(df[df["Debit/Credit"] == "Credit"])
+        credit_count = int(debit_credit_counts.get("Credit", 0))
         st.metric("Credit Transactions", credit_count)
     with col3:
-        debit_count = len(df[df["Debit/Credit"] == "Debit"])
+        debit_count = int(debit_credit_counts.get("Debit", 0))
         st.metric("Debit Transactions", debit_count)
     with col4:
-        unique_parties = len(df[df["Party Name1"] != ""]["Party Name1"].unique())
+        # Mask a single column instead of filtering the whole frame
+        party_names = df["Party Name1"]
+        unique_parties = party_names[party_names.ne("")].nunique()
         st.metric("Unique Parties", unique_parties)
     
-    # Display dataframe
-    st.dataframe(df, use_container_width=True)
+    # Display dataframe. Cap the on-screen preview: st.dataframe ships
+    # the whole frame to the browser on every rerun, and the downloads
+    # below already cover the full data.
+    if len(df) > PREVIEW_ROWS:
+        st.dataframe(df.head(PREVIEW_ROWS), use_container_width=True)
+        st.caption(f"Showing first {PREVIEW_ROWS:,} of {len(df):,} rows - download below for the full data")
+    else:
+        st.dataframe(df, use_container_width=True)
     
     # Show sample of extracted party names
     st.subheader("🔍 Sample Party Name Extraction")
@@ -153,50 +252,66 @@ def display_results(df: pd.DataFrame, bank_option: str, filename: str):
     sample_data = df[sample_cols].head(10)
     st.dataframe(sample_data, use_container_width=True)
     
-    # Download section
+    # Download section. Widget keys and output names carry the upload's
+    # filename so multiple statements on one page don't collide.
     st.subheader("💾 Download Processed File")
-    
-    col1, col2 = st.columns([1, 1])
-    
+
+    base_name = f"{bank_option.replace(' ', '_')}_{filename.rsplit('.', 1)[0]}_Processed"
+    col1, col2, col3 = st.columns([1, 1, 1])
+
     with col1:
-        # Download as Excel
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Processed_Statement")
-        processed_data = output.getvalue()
-        
+        # Download as Excel (serialization cached so widget interactions
+        # elsewhere on the page don't rebuild the workbook)
         st.download_button(
             label="📥 Download Excel File",
-            data=processed_data,
-            file_name=f"{bank_option.replace(' ', '_')}_Processed.xlsx",
+            data=_to_excel_bytes(df),
+            file_name=f"{base_name}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
+            use_container_width=True,
+            key=f"download_excel_{position}_{filename}"
         )
-    
+
     with col2:
         # Download as CSV
-        csv_data = df.to_csv(index=False)
         st.download_button(
             label="📥 Download CSV File",
-            data=csv_data,
-            file_name=f"{bank_option.replace(' ', '_')}_Processed.csv",
+            data=_to_csv_bytes(df),
+            file_name=f"{base_name}.csv",
             mime="text/csv",
-            use_container_width=True
+            use_container_width=True,
+            key=f"download_csv_{position}_{filename}"
         )
-    
+
+    with col3:
+        # Download as Parquet - columnar and compressed, much faster to
+        # write and far smaller than Excel for large statements
+        try:
+            st.download_button(
+                label="📥 Download Parquet File",
+                data=_to_parquet_bytes(df),
+                file_name=f"{base_name}.parquet",
+                mime="application/octet-stream",
+                use_container_width=True,
+                key=f"download_parquet_{position}_{filename}"
+            )
+        except ImportError:
+            st.caption("Install pyarrow for Parquet downloads")
+
     # Show payment category distribution
     if "Payment Category" in df.columns:
         st.subheader("📈 Payment Category Distribution")
+        # Aggregate once; the chart and the top-5 list share the result
         category_counts = df["Payment Category"].value_counts()
-        
+        top_categories = category_counts.head(5)
+
         col1, col2 = st.columns([2, 1])
-        
+
         with col1:
             st.bar_chart(category_counts)
-        
+
         with col2:
             st.write("**Top Categories:**")
-            for category, count in category_counts.head(5).items():
+            for category, count in top_categories.items():
                 st.write(f"• {category}: {count}")
 
 
@@ -2,6 +2,8 @@
 Configuration constants for bank statement processor
 """
 
+import re
+
 # Bank-specific header row configurations
 HEADER_ROWS = {
     "ICICI Yearly": 14,
@@ -12,27 +14,50 @@ HEADER_ROWS = {
 }
 
 # Bank keywords to filter out from party names
-BANK_KEYWORDS = [
+# Frozensets: these are hit by membership checks on every row, and hashed
+# lookup beats scanning a list
+BANK_KEYWORDS = frozenset({
     'ICICI', 'AXIS', 'CANARA', 'SBI', 'HDFC', 'YES', 'BANK',
     'INDIAN', 'PUNJAB NAT', 'BANDHAN BA', 'BARODA', 'BARODA U.P', 'KOTAK',
     'JAMMU', 'JAMMU AND', 'JAMMU &', 'UNION', 'UCOBANK', 'BANKOFBA'
-]
+})
+
+# Compiled alternation over the bank keywords (longest first), standing
+# in for a multi-pattern automaton: the hot "does this part mention a
+# bank" predicate becomes one C-level scan instead of a Python loop of
+# `in` checks
+BANK_KEYWORDS_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(BANK_KEYWORDS, key=len, reverse=True))
+)
 
 # Transaction types to filter out
-TRANSACTION_TYPES = ["MMT", "IMPS", "NEFT", "RTGS", "CMS", "TRF", "CLG", "INF", "INFT"]
+TRANSACTION_TYPES = frozenset({"MMT", "IMPS", "NEFT", "RTGS", "CMS", "TRF", "CLG", "INF", "INFT"})
 
 # Unwanted terms to filter out from party names
-UNWANTED_TERMS = [
-    "ATTN", "PAYMENT", "PAY", "F", "H", "HDFC", "ICICI", "SBI", "AXIS", "YES", "BANK", 
-    "BANQUE", "BULD", "BANK", "HDFC BANK", "KOTAK MAHINDRA BANK", "MAHINDRA BANK"
-]
+UNWANTED_TERMS = frozenset({
+    "ATTN", "PAYMENT", "PAY", "F", "H", "HDFC", "ICICI", "SBI", "AXIS", "YES", "BANK",
+    "BANQUE", "BULD", "HDFC BANK", "KOTAK MAHINDRA BANK", "MAHINDRA BANK"
+})
 
 # Month names to filter out
-MONTHS = [
-    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY', 
-    'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JAN', 'FEB', 
+MONTHS = frozenset({
+    'JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY',
+    'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JAN', 'FEB',
     'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC'
-]
+})
+
+# Single alternation covering every term scrubbed from party names,
+# compiled once at import so cleaning is one regex pass instead of a
+# Python loop over the term lists (longest terms first so e.g.
+# 'HDFC BANK' wins over 'HDFC')
+SCRUB_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(term)
+        for term in sorted(BANK_KEYWORDS | UNWANTED_TERMS | TRANSACTION_TYPES | MONTHS,
+                           key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
 
 # Payment category mappings
 PAYMENT_CATEGORY_MAP = {
@@ -99,18 +124,35 @@ JANA_COLUMN_PATTERNS = {
     'Balance': ['running balance']
 }
 
-# RBL Bank column mapping patterns
+# RBL Bank column mapping patterns (RBL headers vary a lot between
+# exports, so these lists carry the looser fallbacks too)
 RBL_COLUMN_PATTERNS = {
-    'S.N.': ['s.no', 'sno'],
-    'Transaction Date': ['transaction date'],
-    'Value Date': ['value date'],
-    'Transaction Details': ['transaction details'],
+    'S.N.': ['s.no', 'sno', 'sl', 'sl.', 'serial'],
+    'Transaction Date': ['transaction date', 'trans date', 'date', 'txn date'],
+    'Value Date': ['value date', 'val date'],
+    'Transaction Details': ['transaction details', 'transaction detail', 'particulars',
+                            'description', 'narration', 'details'],
     'Cheque ID': ['cheque id', 'cheque'],
-    'Withdrawal Amt': ['withdrawl', 'withdrawal'],
-    'Deposit Amt': ['deposit'],
-    'Balance': ['balance']
+    'Withdrawal Amt': ['withdrawl', 'withdrawal', 'debit', 'dr', 'withdraw'],
+    'Deposit Amt': ['deposit', 'credit', 'cr'],
+    'Balance': ['balance', 'bal', 'running balance', 'closing balance']
 }
 
+def _compile_column_patterns(patterns):
+    """Compile one alternation regex per canonical column name"""
+    return {
+        standard_name: re.compile('|'.join(re.escape(p) for p in pats))
+        for standard_name, pats in patterns.items()
+    }
+
+
+# Precompiled header matchers: each canonical column gets a single
+# alternation regex, so mapping a header is one C-level scan instead of
+# a Python loop over every pattern string
+AXIS_COLUMN_RES = _compile_column_patterns(AXIS_COLUMN_PATTERNS)
+JANA_COLUMN_RES = _compile_column_patterns(JANA_COLUMN_PATTERNS)
+RBL_COLUMN_RES = _compile_column_patterns(RBL_COLUMN_PATTERNS)
+
 # Supported banks
 SUPPORTED_BANKS = ["ICICI Yearly", "ICICI Monthly", "AXIS", "Jana Bank", "RBL Bank"]
 
@@ -1,11 +1,28 @@
 """
 Parser initialization
+
+Parser modules are imported lazily (PEP 562) so a Streamlit cold start
+only pays for the bank actually selected; each module's regex compiles
+and imports run on first attribute access.
 """
 
-from parsers.base_parser import BaseBankParser
-from parsers.icici_parser import ICICIParser
-from parsers.axis_parser import AXISParser
-from parsers.jana_parser import JanaParser
-from parsers.rbl_parser import RBLParser
+_PARSER_MODULES = {
+    'BaseBankParser': 'parsers.base_parser',
+    'ICICIParser': 'parsers.icici_parser',
+    'AXISParser': 'parsers.axis_parser',
+    'JanaParser': 'parsers.jana_parser',
+    'RBLParser': 'parsers.rbl_parser',
+}
 
 __all__ = ['BaseBankParser', 'ICICIParser', 'AXISParser', 'JanaParser', 'RBLParser']
+
+
+def __getattr__(name):
+    """Import the requested parser class on first access"""
+    if name in _PARSER_MODULES:
+        import importlib
+        module = importlib.import_module(_PARSER_MODULES[name])
+        cls = getattr(module, name)
+        globals()[name] = cls  # cache so later lookups skip __getattr__
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
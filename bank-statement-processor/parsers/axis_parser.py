@@ -3,21 +3,66 @@ AXIS Bank parser
 """
 
 import pandas as pd
+import numpy as np
 import re
 from typing import Tuple, Dict
 from parsers.base_parser import BaseBankParser
-from config import AXIS_COLUMN_PATTERNS, HEADER_ROWS, BANK_KEYWORDS
+from config import AXIS_COLUMN_PATTERNS, HEADER_ROWS, BANK_KEYWORDS, BANK_KEYWORDS_RE
 from utils import (
-    is_valid_party_name, clean_party_name, clean_amount, 
-    format_date, determine_debit_credit, split_transaction_description, read_excel_file,
-    add_remark_column
+    is_valid_party_name, clean_party_name,
+    determine_debit_credit, split_transaction_description, read_excel_file,
+    add_remark_column, find_header_row, clean_amount_column, format_date_column
 )
 
 
+# Compiled once at import: these run per part per row in
+# _extract_party_names. The bank-name patterns collapse into a single
+# alternation so one match replaces a loop of twelve.
+_BANK_NAME_RE = re.compile(
+    r'(?:STATE\s+BANK'
+    r'|BANK\s+OF(?:\s+[A-Z]+)?'
+    r'|[A-Z]+\s+BANK$'
+    r'|HDFC|ICICI|AXIS|SBI|KOTAK'
+    r'|YES\s+BANK|UNION\s+BANK|CANARA\s+BANK)'
+)
+_ALPHA_RE = re.compile(r'[A-Za-z]')
+_BANKCODE_RE = re.compile(r'^[A-Z]{3,4}\d+[A-Z]*\d*$')
+
+
+# Transaction types detectable from a marker in the first segment alone,
+# in priority order. CLG, MOB, CASH, IMPS, and INB need extra context
+# and are handled explicitly in _detect_transaction_type.
+_TYPE_TABLE = {
+    'NEFT': ('NEFT', 'NEFT'),
+    'TRF': ('TRF', 'TRANSFER'),
+    'MMT': ('MMT', 'MOBILE TRANSFER'),
+    'IFT': ('IFT', 'INSTANT FUND TRANSFER'),
+    'RTGS': ('RTGS', 'RTGS'),
+}
+
+# Header mapping: every canonical column's patterns fused into one
+# alternation with a capture group per canonical name (longest pattern
+# first within each group), so mapping a header is a single scan whose
+# matched group resolves the standard column directly
+_AXIS_HEADER_GROUPS = list(AXIS_COLUMN_PATTERNS)
+_AXIS_HEADER_RE = re.compile('|'.join(
+    '(%s)' % '|'.join(
+        re.escape(p) for p in sorted(AXIS_COLUMN_PATTERNS[std], key=len, reverse=True)
+    )
+    for std in _AXIS_HEADER_GROUPS
+))
+
 
 class AXISParser(BaseBankParser):
     """Parser for AXIS Bank statements"""
-    
+
+    # Output schema produced by _process_row
+    OUTPUT_COLUMNS = (
+        'S.N.', 'Transaction Date', 'Particulars', 'Withdrawal Amt (INR)',
+        'Deposit Amt (INR)', 'Balance (INR)', 'Debit/Credit',
+        'Payment Category', 'Party Name1', 'Party Name2'
+    )
+
     def __init__(self):
         super().__init__("AXIS")
         self.header_row = HEADER_ROWS["AXIS"]
@@ -31,34 +76,30 @@ class AXISParser(BaseBankParser):
             # Row 21 (0-indexed) is empty, so we'll drop it after reading
             header_row_0_indexed = self.header_row - 1  # Row 20 (1-indexed) = Row 19 (0-indexed)
             df = read_excel_file(file_path, header=header_row_0_indexed, dtype=str)
-            # Drop the first row (row 21, which is empty) so data starts from row 22
+            # Drop the first row (row 21, which is empty) so data starts
+            # from row 22. The slice is a copy-on-write view; assigning
+            # a fresh RangeIndex avoids the second copy reset_index made.
             if not df.empty:
-                df = df.iloc[1:].reset_index(drop=True)
+                df = df.iloc[1:]
+                df.index = pd.RangeIndex(len(df))
             df = self.clean_dataframe(df)
             
             # Check if dataframe is empty after reading
             if df.empty:
                 # Try reading without header to find the correct header row
                 df_temp = read_excel_file(file_path, header=None, nrows=30, dtype=str)
-                # Look for header row by checking for column keywords
+                # Look for header row by checking for column keywords,
+                # counted in one vectorized substring pass per keyword
                 header_keywords = ['particular', 'transaction', 'date', 'amount', 'debit', 'credit', 'balance']
-                for idx in range(min(30, len(df_temp))):
-                    row_values = [str(val).lower().strip() for val in df_temp.iloc[idx].values if pd.notna(val)]
-                    matches = sum(1 for keyword in header_keywords if any(keyword in val for val in row_values))
-                    if matches >= 3:  # Found at least 3 header keywords
-                        # Try reading with this header row
-                        df = read_excel_file(file_path, header=idx, dtype=str)
-                        df = self.clean_dataframe(df)
-                        break
+                header_idx = find_header_row(df_temp, header_keywords)
+                if header_idx is not None:
+                    # Try reading with this header row
+                    df = read_excel_file(file_path, header=header_idx, dtype=str)
+                    df = self.clean_dataframe(df)
                 
                 if df.empty:
                     raise ValueError("Could not find data in the file. Please check if this is a valid AXIS Bank statement.")
             
-            # Remove rows with "OPENING BALANCE"
-            df = df[~df.astype(str).apply(
-                lambda x: x.str.contains('OPENING BALANCE', case=False, na=False)
-            ).any(axis=1)]
-            
             # Clean column names
             df.columns = [str(col).strip() for col in df.columns]
             
@@ -75,105 +116,233 @@ class AXISParser(BaseBankParser):
                     f"Available columns: {available_cols}. "
                     f"Please check if this is an AXIS Bank statement file."
                 )
-            
-            # Process data
-            processed_data = []
-            for idx, row in df.iterrows():
-                # Check if Particulars column exists and has data
-                particulars_col = column_mapping.get('Particulars', '')
-                if not particulars_col:
-                    continue
-                    
-                if pd.isna(row.get(particulars_col, '')) or str(row.get(particulars_col, '')).strip() == '':
-                    continue
-                
-                processed_row = self._process_row(row, column_mapping)
-                if processed_row:
-                    processed_data.append(processed_row)
-            
-            if not processed_data:
+
+            # Move the hot text columns onto the Arrow-backed string
+            # dtype once, so every .str scan below (opening-balance
+            # filter, Dr/Cr uppercase, classification) dispatches to
+            # Arrow's C kernels instead of the object path
+            for standard_name in ('Particulars', 'Debit/Credit'):
+                mapped_col = column_mapping.get(standard_name)
+                if mapped_col is not None:
+                    df[mapped_col] = df[mapped_col].astype('string[pyarrow]')
+
+            # Remove rows with "OPENING BALANCE". One vectorized scan of
+            # Particulars (regex=False keeps it on the C substring path)
+            # replaces casting and regex-matching the entire frame; the
+            # column already carries the string dtype from the cast above.
+            opening_mask = df[column_mapping['Particulars']].str.contains(
+                'OPENING BALANCE', case=False, na=False, regex=False
+            )
+            df = df[~opening_mask]
+
+            # Resolve mapped columns to tuple positions once, including
+            # the fallback date and withdrawal/deposit scans, so the row
+            # loop can run over plain tuples instead of materializing a
+            # Series per row
+            cols = self._resolve_column_positions(df.columns, column_mapping)
+            particulars_idx = cols['particulars']
+
+            # Normalize the loop's raw text inputs column-wide: NaN
+            # filled, whitespace stripped, and Dr/Cr uppercased in one
+            # vectorized pass each, so _process_row indexes the row
+            # tuple directly instead of wrapping cells in str().strip()
+            particulars_col = column_mapping['Particulars']
+            df[particulars_col] = df[particulars_col].fillna('').str.strip()
+            if cols['drcr'] is not None:
+                drcr_col = column_mapping['Debit/Credit']
+                df[drcr_col] = df[drcr_col].fillna('').str.upper().str.strip()
+
+            # Classify the whole Particulars column up front; the row
+            # loop only handles party extraction, which is per-row
+            txn_types, categories = self._classify_particulars(df[column_mapping['Particulars']])
+
+            # Clean amounts and dates column-wide up front (one C pass
+            # per column) so the row loop reads precomputed values
+            # instead of calling clean_amount/format_date several times
+            # per row
+            amount_positions = {cols['amount'], cols['balance']}
+            amount_positions.update(i for _, i in cols['wd_fallbacks'])
+            amounts = {i: clean_amount_column(df.iloc[:, i]).tolist()
+                       for i in amount_positions if i is not None}
+
+            date_positions = set(cols['date_fallbacks'])
+            if cols['date'] is not None:
+                date_positions.add(cols['date'])
+            dates = {i: format_date_column(df.iloc[:, i]).tolist()
+                     for i in date_positions}
+
+            # Derive Debit/Credit and split the amount into the
+            # withdrawal/deposit columns in a few np.where passes ('CR'
+            # wins over 'DR' like the old per-row branch). Rows the
+            # Dr/Cr column can't decide keep the empty marker and fall
+            # through to the per-row fallback scan.
+            n_rows = len(df)
+            if cols['amount'] is not None:
+                amt_arr = np.asarray(amounts[cols['amount']], dtype=object)
+            else:
+                amt_arr = np.full(n_rows, '0', dtype=object)
+            if cols['drcr'] is not None:
+                dc = df.iloc[:, cols['drcr']]
+                is_cr = dc.str.contains('CR', regex=False, na=False).to_numpy()
+                is_dr = dc.str.contains('DR', regex=False, na=False).to_numpy() & ~is_cr
+                dc_split = (
+                    np.where(is_cr, 'Credit', np.where(is_dr, 'Debit', '')),
+                    np.where(is_dr, amt_arr, '0'),
+                    np.where(is_cr, amt_arr, '0'),
+                )
+            else:
+                dc_split = (
+                    np.full(n_rows, '', dtype=object),
+                    np.full(n_rows, '0', dtype=object),
+                    np.full(n_rows, '0', dtype=object),
+                )
+
+            # Cash categories depend on the final direction. Fix them
+            # up vectorized for the rows the Dr/Cr column decided; rows
+            # left undecided are re-checked per row once the
+            # withdrawal/deposit fallback scan has run.
+            is_cash = np.char.startswith(np.asarray(categories, dtype=str), 'CASH')
+            categories = np.where(
+                is_cash & (dc_split[0] == 'Credit'), 'CASH DEPOSIT',
+                np.where(is_cash & (dc_split[0] == 'Debit'), 'CASH WITHDRAWAL', categories)
+            )
+
+            # Process data. Accumulate per-column lists instead of a
+            # list of row dicts so pd.DataFrame builds each column in
+            # one shot rather than unifying dtypes row by row. The dict
+            # also fixes the output schema, replacing the old
+            # essential-columns reprojection (and its column copies).
+            out_columns = {col: [] for col in self.OUTPUT_COLUMNS}
+            row_count = 0
+            if particulars_idx is not None:
+                for pos, values in enumerate(df.itertuples(index=False, name=None)):
+                    # Column was filled and stripped above
+                    particulars = values[particulars_idx]
+                    if not particulars:
+                        continue
+
+                    processed_row = self._process_row(values, cols, txn_types[pos], categories[pos],
+                                                      amounts, dates, dc_split, pos)
+                    if processed_row:
+                        for col, out_values in out_columns.items():
+                            out_values.append(processed_row[col])
+                        row_count += 1
+
+            if not row_count:
                 raise ValueError(
                     f"No transaction data found. Please check if the file contains transaction rows. "
                     f"Found columns: {list(df.columns)}. "
                     f"Column mapping: {column_mapping}"
                 )
-            
-            df = pd.DataFrame(processed_data)
-            
-            # Keep only essential columns
-            essential_cols = [
-                'S.N.', 'Transaction Date', 'Particulars', 'Withdrawal Amt (INR)', 
-                'Deposit Amt (INR)', 'Balance (INR)', 'Debit/Credit', 
-                'Payment Category', 'Party Name1', 'Party Name2'
-            ]
-            df = df[[col for col in essential_cols if col in df.columns]]
-            
+
+            df = pd.DataFrame(out_columns)
+
             # Add Remark column using strict rule-based classification
             df = add_remark_column(df, "Particulars", "Payment Category")
-            
+
+            # Label columns hold a handful of distinct values; category
+            # dtype stores int codes plus a small dictionary instead of
+            # a Python str object per row
+            for col in ('Debit/Credit', 'Payment Category'):
+                df[col] = df[col].astype('category')
+
             return df
             
         except Exception as e:
             raise Exception(f"Error processing AXIS Bank statement: {e}")
     
-    def parse_transaction_description(self, particulars: str) -> pd.Series:
+    def parse_transaction_description(self, particulars: str) -> Tuple[str, str, str]:
         """Parse AXIS transaction particulars"""
         if pd.isna(particulars) or particulars.strip() == "":
-            return pd.Series(["", "", ""])
-        
+            return "", "", ""
+
         particulars_clean = particulars.strip()
+        txn_type, payment_category = self._detect_transaction_type(particulars_clean)
+        party1, party2 = self._extract_clean_parties(particulars_clean, txn_type)
+
+        return payment_category, party1, party2
+
+    def _detect_transaction_type(self, particulars_clean: str) -> Tuple[str, str]:
+        """Detect transaction type and payment category for one row"""
         parts = [p.strip() for p in particulars_clean.split('/') if p.strip()]
-        
-        payment_category = ""
-        party1 = ""
-        party2 = ""
-        txn_type = ""
+        # Uppercase each scanned string once instead of per check
         first_part = parts[0].upper() if len(parts) > 0 else ""
-        
-        # Detect payment category
+        second_part = parts[1].upper() if len(parts) > 1 else ""
+        particulars_upper = particulars_clean.upper()
+
         if 'CLG' in first_part:
-            txn_type = 'CLG'
-            payment_category = 'CHEQUE CLEARING'
-        elif 'MOB' in first_part or (len(parts) > 1 and 'TPFT' in parts[1].upper()):
-            txn_type = 'MOB'
-            payment_category = 'MOBILE TRANSFER'
-        elif 'CASH' in particulars_clean.upper():
-            txn_type = 'CASH'
-            # Default to CASH DEPOSIT, will be validated later based on debit/credit
-            if 'WITHDRAW' in particulars_clean.upper() or 'WD' in particulars_clean.upper():
-                payment_category = 'CASH WITHDRAWAL'
-            else:
-                payment_category = 'CASH DEPOSIT'
-        elif 'NEFT' in first_part:
-            txn_type = 'NEFT'
-            payment_category = 'NEFT'
-        elif 'TRF' in first_part:
-            txn_type = 'TRF'
-            payment_category = 'TRANSFER'
-        elif 'MMT' in first_part:
-            txn_type = 'MMT'
-            payment_category = 'MOBILE TRANSFER'
-        elif 'IFT' in first_part:
-            txn_type = 'IFT'
-            payment_category = 'INSTANT FUND TRANSFER'
-        elif 'RTGS' in first_part:
-            txn_type = 'RTGS'
-            payment_category = 'RTGS'
-        elif 'IMPS' in first_part or (len(parts) > 1 and 'P2A' in parts[1].upper()):
-            txn_type = 'IMPS'
-            payment_category = 'IMPS'
-        elif 'INB' in first_part:
-            if len(parts) > 1:
-                if 'IFT' in parts[1].upper():
-                    txn_type = 'INB/IFT'
-                    payment_category = 'INSTANT FUND TRANSFER'
-                elif 'RTGS' in parts[1].upper():
-                    txn_type = 'INB/RTGS'
-                    payment_category = 'RTGS'
-        
-        # Extract Party Name
+            return 'CLG', 'CHEQUE CLEARING'
+        if 'MOB' in first_part or 'TPFT' in second_part:
+            return 'MOB', 'MOBILE TRANSFER'
+        if 'CASH' in particulars_upper:
+            # Default to CASH DEPOSIT, validated later based on debit/credit
+            if 'WITHDRAW' in particulars_upper or 'WD' in particulars_upper:
+                return 'CASH', 'CASH WITHDRAWAL'
+            return 'CASH', 'CASH DEPOSIT'
+        for marker, type_and_category in _TYPE_TABLE.items():
+            if marker in first_part:
+                return type_and_category
+        if 'IMPS' in first_part or 'P2A' in second_part:
+            return 'IMPS', 'IMPS'
+        if 'INB' in first_part and second_part:
+            if 'IFT' in second_part:
+                return 'INB/IFT', 'INSTANT FUND TRANSFER'
+            if 'RTGS' in second_part:
+                return 'INB/RTGS', 'RTGS'
+        return '', ''
+
+    def _classify_particulars(self, particulars: pd.Series) -> Tuple:
+        """Vectorized transaction type/category detection over a column
+
+        Mirrors _detect_transaction_type, but each branch of the chain
+        becomes one boolean mask so the whole column is classified in a
+        handful of C passes instead of a Python call per row.
+        """
+        p_upper = particulars.fillna("").astype(str).str.strip().str.upper()
+        segments = p_upper.str.split('/')
+        first = segments.str[0].fillna("").str.strip()
+        second = segments.str[1].fillna("").str.strip()
+
+        conditions = [
+            first.str.contains('CLG', regex=False),
+            first.str.contains('MOB', regex=False) | second.str.contains('TPFT', regex=False),
+            p_upper.str.contains('CASH', regex=False),
+            first.str.contains('NEFT', regex=False),
+            first.str.contains('TRF', regex=False),
+            first.str.contains('MMT', regex=False),
+            first.str.contains('IFT', regex=False),
+            first.str.contains('RTGS', regex=False),
+            first.str.contains('IMPS', regex=False) | second.str.contains('P2A', regex=False),
+            first.str.contains('INB', regex=False) & second.str.contains('IFT', regex=False),
+            first.str.contains('INB', regex=False) & second.str.contains('RTGS', regex=False),
+        ]
+        txn_types = np.select(
+            conditions,
+            ['CLG', 'MOB', 'CASH', 'NEFT', 'TRF', 'MMT', 'IFT', 'RTGS', 'IMPS',
+             'INB/IFT', 'INB/RTGS'],
+            default=''
+        )
+
+        # CASH splits on withdrawal markers; every other type maps to a
+        # single category
+        cash_category = np.where(
+            p_upper.str.contains('WITHDRAW', regex=False) | p_upper.str.contains('WD', regex=False),
+            'CASH WITHDRAWAL', 'CASH DEPOSIT'
+        )
+        categories = np.select(
+            conditions,
+            ['CHEQUE CLEARING', 'MOBILE TRANSFER', cash_category, 'NEFT', 'TRANSFER',
+             'MOBILE TRANSFER', 'INSTANT FUND TRANSFER', 'RTGS', 'IMPS',
+             'INSTANT FUND TRANSFER', 'RTGS'],
+            default=''
+        )
+        return txn_types, categories
+
+    def _extract_clean_parties(self, particulars_clean: str, txn_type: str) -> Tuple[str, str]:
+        """Extract and clean both party names for one row"""
+        parts = [p.strip() for p in particulars_clean.split('/') if p.strip()]
         party1, party2 = self._extract_party_names(parts, txn_type)
-        
+
         # Clean party names, but be careful not to remove valid parts like "Bank" in "State Bank"
         # Only do light cleaning for CLG transactions to preserve full party names
         if txn_type == 'CLG':
@@ -183,11 +352,14 @@ class AXISParser(BaseBankParser):
             if party2:
                 party2 = ' '.join(party2.split()).strip()
         else:
-            # For other transaction types, use standard cleaning
-            party1 = clean_party_name(party1)
-            party2 = clean_party_name(party2)
-        
-        return pd.Series([payment_category, party1, party2])
+            # For other transaction types, use standard cleaning.
+            # party2 mirrors party1, so clean the second name only when
+            # it actually differs.
+            cleaned1 = clean_party_name(party1)
+            party2 = cleaned1 if party2 == party1 else clean_party_name(party2)
+            party1 = cleaned1
+
+        return party1, party2
     
     def _map_columns(self, columns: list) -> Dict[str, str]:
         """Map column names to standard names"""
@@ -195,13 +367,15 @@ class AXISParser(BaseBankParser):
         
         for col in columns:
             col_lower = str(col).lower().strip()
-            for standard_name, patterns in AXIS_COLUMN_PATTERNS.items():
-                if any(pattern in col_lower for pattern in patterns):
-                    # Only map if not already mapped
-                    if standard_name not in column_mapping:
-                        column_mapping[standard_name] = col
-                    break
-        
+            # One scan of the fused alternation; the matched capture
+            # group tells us which canonical column this header is
+            match = _AXIS_HEADER_RE.search(col_lower)
+            if match:
+                standard_name = _AXIS_HEADER_GROUPS[match.lastindex - 1]
+                # Only map if not already mapped
+                if standard_name not in column_mapping:
+                    column_mapping[standard_name] = col
+
         # Additional fallback mappings for common variations
         if 'Particulars' not in column_mapping:
             for col in columns:
@@ -243,111 +417,121 @@ class AXISParser(BaseBankParser):
         
         return column_mapping
     
-    def _process_row(self, row: pd.Series, column_mapping: Dict[str, str]) -> Dict:
-        """Process a single row of data"""
-        # Extract transaction date
+    def _resolve_column_positions(self, columns, column_mapping: Dict[str, str]) -> Dict:
+        """Resolve mapped and fallback columns to tuple positions
+
+        Done once per file so _process_row never walks row.index or the
+        column mapping dict again.
+        """
+        col_idx = {col: i for i, col in enumerate(columns)}
+        lowered = [str(col).lower() for col in columns]
+
+        # Withdrawal/deposit fallback columns, tagged by direction, in
+        # original column order ('w' wins over 'd' like the old elif)
+        wd_fallbacks = []
+        for i, col_lower in enumerate(lowered):
+            if 'withdraw' in col_lower or 'debit' in col_lower:
+                wd_fallbacks.append(('w', i))
+            elif 'deposit' in col_lower or 'credit' in col_lower:
+                wd_fallbacks.append(('d', i))
+
+        return {
+            'sn': col_idx.get(column_mapping.get('S.N.')),
+            'date': col_idx.get(column_mapping.get('Transaction Date')),
+            'particulars': col_idx.get(column_mapping.get('Particulars')),
+            'amount': col_idx.get(column_mapping.get('Amount(INR)')),
+            'drcr': col_idx.get(column_mapping.get('Debit/Credit')),
+            'balance': col_idx.get(column_mapping.get('Balance(INR)')),
+            'date_fallbacks': [i for i, col_lower in enumerate(lowered) if 'date' in col_lower],
+            'wd_fallbacks': wd_fallbacks,
+        }
+
+    def _process_row(self, values: tuple, cols: Dict, txn_type: str,
+                     payment_category: str, amounts: Dict, dates: Dict,
+                     dc_split: tuple, pos: int) -> Dict:
+        """Process a single row, delivered as a plain tuple of values
+
+        amounts and dates hold the column-wise cleaned values keyed by
+        column position; dc_split holds the vectorized Debit/Credit,
+        withdrawal, and deposit arrays; pos selects this row from them.
+        """
+        def value_at(idx):
+            return values[idx] if idx is not None else None
+
+        # Extract transaction date (cleaned column-wide in process_file)
         transaction_date = ""
-        if 'Transaction Date' in column_mapping:
-            date_str = str(row.get(column_mapping['Transaction Date'], '')).strip()
-            transaction_date = format_date(date_str)
-        
+        if cols['date'] is not None:
+            transaction_date = dates[cols['date']][pos]
+
         # Try to get date from other date columns if Transaction Date not found
-        if not transaction_date or transaction_date == "":
-            # Try Value Date or any column with 'date' in name
-            for col in row.index:
-                if 'date' in str(col).lower():
-                    date_str = str(row.get(col, '')).strip()
-                    transaction_date = format_date(date_str)
-                    if transaction_date:
-                        break
-        
-        # Skip rows without transaction date (but be lenient - only skip if we have no date info at all)
-        if not transaction_date or transaction_date == "":
-            # Still try to process if we have particulars and amount
-            pass  # Don't skip yet, check particulars first
-        
-        # Extract particulars
-        particulars = str(row.get(column_mapping.get('Particulars', ''))).strip()
-        
+        if not transaction_date:
+            for i in cols['date_fallbacks']:
+                transaction_date = dates[i][pos]
+                if transaction_date:
+                    break
+
+        # Extract particulars (already filled and stripped column-wide)
+        particulars = value_at(cols['particulars']) or ''
+
         # Skip if no particulars
-        if not particulars or particulars.lower() in ['nan', 'none', '']:
+        if not particulars or particulars.lower() in ['nan', 'none']:
             return None
-        
-        # Extract amount and clean it
-        amount_str = str(row.get(column_mapping.get('Amount(INR)', ''))).strip()
-        amount = clean_amount(amount_str)
-        
-        # Determine debit/credit
-        debit_credit = ''
-        withdrawal_amt = '0'
-        deposit_amt = '0'
-        
-        if 'Debit/Credit' in column_mapping:
-            debit_credit_col = str(row.get(column_mapping.get('Debit/Credit', ''))).strip().upper()
-            if 'CR' in debit_credit_col:
-                debit_credit = 'Credit'
-                withdrawal_amt = '0'
-                deposit_amt = str(amount)
-            elif 'DR' in debit_credit_col:
-                debit_credit = 'Debit'
-                withdrawal_amt = str(amount)
-                deposit_amt = '0'
-        
+
+        # Amount was cleaned column-wide in process_file
+        amount = amounts[cols['amount']][pos] if cols['amount'] is not None else '0'
+
+        # Debit/Credit and the withdrawal/deposit split were derived
+        # column-wide in process_file
+        debit_credit = dc_split[0][pos]
+        withdrawal_amt = dc_split[1][pos]
+        deposit_amt = dc_split[2][pos]
+
         # Fallback: Try to determine from withdrawal/deposit columns if Debit/Credit column not found
         if not debit_credit:
-            # Check for separate withdrawal and deposit columns
-            for col in row.index:
-                col_lower = str(col).lower()
-                if 'withdraw' in col_lower or 'debit' in col_lower:
-                    withdraw_str = str(row.get(col, '')).strip()
-                    withdraw_amt = clean_amount(withdraw_str)
-                    if withdraw_amt and withdraw_amt != '0':
+            for kind, i in cols['wd_fallbacks']:
+                amt = amounts[i][pos]
+                if amt and amt != '0':
+                    if kind == 'w':
                         debit_credit = 'Debit'
-                        withdrawal_amt = withdraw_amt
+                        withdrawal_amt = amt
                         deposit_amt = '0'
-                        break
-                elif 'deposit' in col_lower or 'credit' in col_lower:
-                    deposit_str = str(row.get(col, '')).strip()
-                    deposit_amt_val = clean_amount(deposit_str)
-                    if deposit_amt_val and deposit_amt_val != '0':
+                    else:
                         debit_credit = 'Credit'
                         withdrawal_amt = '0'
-                        deposit_amt = deposit_amt_val
-                        break
-            
+                        deposit_amt = amt
+                    break
+
             # If still not determined, use amount and assume it's based on context
             if not debit_credit and amount and amount != '0':
                 # Default to Debit if we can't determine
                 debit_credit = 'Debit'
-                withdrawal_amt = str(amount)
+                withdrawal_amt = amount
                 deposit_amt = '0'
-        
-        # Extract balance and clean it
-        balance_str = str(row.get(column_mapping.get('Balance(INR)', ''))).strip()
-        balance = clean_amount(balance_str)
-        
-        # Parse payment category and party names from particulars
-        payment_category, party1, party2 = self.parse_transaction_description(particulars)
-        
+
+        # Balance was cleaned column-wide in process_file
+        balance = amounts[cols['balance']][pos] if cols['balance'] is not None else '0'
+
+        # Party names still need per-row extraction; the category came
+        # from the vectorized classification pass
+        party1, party2 = self._extract_clean_parties(particulars, txn_type)
+
         # Validate cash transactions based on debit/credit
         # Credit + Cash = CASH DEPOSIT, Debit + Cash = CASH WITHDRAWAL
-        if 'CASH' in payment_category.upper():
+        # The Dr/Cr-decided rows were already fixed up vectorized; this
+        # covers rows whose direction came from the fallback scan
+        if not dc_split[0][pos] and 'CASH' in payment_category.upper():
             if debit_credit == 'Credit':
                 payment_category = 'CASH DEPOSIT'
             elif debit_credit == 'Debit':
                 payment_category = 'CASH WITHDRAWAL'
-        
-        # Use empty string for transaction date if not found (don't skip the row)
-        if not transaction_date:
-            transaction_date = ""
-        
+
         return {
-            'S.N.': str(row.get(column_mapping.get('S.N.', ''))),
+            'S.N.': str(value_at(cols['sn'])),
             'Transaction Date': transaction_date,
             'Particulars': particulars,
             'Withdrawal Amt (INR)': withdrawal_amt,
             'Deposit Amt (INR)': deposit_amt,
-            'Balance (INR)': str(balance),
+            'Balance (INR)': balance,
             'Debit/Credit': debit_credit,
             'Payment Category': payment_category,
             'Party Name1': party1,
@@ -381,32 +565,16 @@ class AXISParser(BaseBankParser):
                 return False
             part_upper = part.upper().strip()
             
-            # Check against known bank keywords
-            for bank_keyword in BANK_KEYWORDS:
-                if bank_keyword.upper() in part_upper or part_upper in bank_keyword.upper():
-                    return True
-            
-            # Common bank name patterns
-            bank_patterns = [
-                r'^STATE\s+BANK',
-                r'^BANK\s+OF',
-                r'^BANK\s+OF\s+[A-Z]+',  # Bank Of Baroda, Bank Of India, etc.
-                r'^[A-Z]+\s+BANK$',  # Any word followed by "BANK" at the end
-                r'^HDFC',
-                r'^ICICI',
-                r'^AXIS',
-                r'^SBI',
-                r'^KOTAK',
-                r'^YES\s+BANK',
-                r'^UNION\s+BANK',
-                r'^CANARA\s+BANK',
-            ]
-            
-            for pattern in bank_patterns:
-                if re.match(pattern, part_upper):
-                    return True
+            # Check against known bank keywords: forward containment is
+            # one alternation scan; the reverse check (part inside a
+            # keyword) stays a short loop
+            if BANK_KEYWORDS_RE.search(part_upper):
+                return True
+            if any(part_upper in bank_keyword for bank_keyword in BANK_KEYWORDS):
+                return True
             
-            return False
+            # Common bank name patterns, matched in one compiled pass
+            return bool(_BANK_NAME_RE.match(part_upper))
         
         if txn_type in ['CLG']:
             # CLG format: CLG/CHEQUE_NUM/DATE/PARTY_NAME or CLG/CHEQUE_NUM/REFERENCE/PARTY_NAME
@@ -434,9 +602,9 @@ class AXISParser(BaseBankParser):
                 combined_all = ' '.join(party_parts)
                 combined_all = ' '.join(combined_all.split())  # Clean up extra spaces
                 
-                if combined_all and len(combined_all) >= 4 and re.search(r'[A-Za-z]', combined_all):
+                if combined_all and len(combined_all) >= 4 and _ALPHA_RE.search(combined_all):
                     # Don't accept if it's just a bank code pattern
-                    if not re.match(r'^[A-Z]{3,4}\d+[A-Z]*\d*$', combined_all):
+                    if not _BANKCODE_RE.match(combined_all):
                         party1 = combined_all
                         party2 = combined_all
             
@@ -445,7 +613,7 @@ class AXISParser(BaseBankParser):
                 for i in range(3, len(parts)):
                     part = parts[i].strip()
                     if part and not is_reference_code(part) and not is_bank_name(part):
-                        if len(part) >= 4 and re.search(r'[A-Za-z]', part):
+                        if len(part) >= 4 and _ALPHA_RE.search(part):
                             party1 = part
                             party2 = part
                             break
@@ -458,7 +626,7 @@ class AXISParser(BaseBankParser):
                 party_name = parts[2].strip()
                 # Check if it's not a reference code
                 if not is_reference_code(party_name):
-                    if is_valid_party_name(party_name) and not any(bank in party_name.upper() for bank in BANK_KEYWORDS):
+                    if is_valid_party_name(party_name) and not BANK_KEYWORDS_RE.search(party_name.upper()):
                         party1 = party_name
                         party2 = party_name
                     elif len(party_name) >= 4:  # If it looks reasonable
@@ -472,7 +640,7 @@ class AXISParser(BaseBankParser):
                             if next_part and not is_reference_code(next_part):
                                 party_parts.append(next_part)
                                 combined = ' '.join(party_parts)
-                                if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                                if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined.upper()):
                                     party1 = combined
                                     party2 = combined
                                     break
@@ -482,7 +650,7 @@ class AXISParser(BaseBankParser):
             if len(parts) >= 1:
                 potential_party = parts[-1].strip()
                 if potential_party and not is_reference_code(potential_party):
-                    if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
+                    if is_valid_party_name(potential_party) and not BANK_KEYWORDS_RE.search(potential_party.upper()):
                         party1 = potential_party
                         party2 = potential_party
         else:
@@ -501,7 +669,7 @@ class AXISParser(BaseBankParser):
                     continue
                 part = parts[i].strip()
                 if part and not is_reference_code(part):
-                    if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
+                    if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(part.upper()):
                         party1 = part
                         party2 = part
                         break
@@ -516,10 +684,17 @@ class AXISParser(BaseBankParser):
                             valid_parts.append(part)
                 
                 if valid_parts:
+                    # Uppercase once; the candidates below grow
+                    # incrementally instead of re-joining and
+                    # re-uppercasing the slice for every (i, j) pair
+                    valid_parts_upper = [p.upper() for p in valid_parts]
                     for i in range(min(len(valid_parts), 5)):
+                        combined = valid_parts[i]
+                        combined_upper = valid_parts_upper[i]
                         for j in range(i+1, min(len(valid_parts), i+3)):
-                            combined = ' '.join(valid_parts[i:j+1])
-                            if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                            combined += ' ' + valid_parts[j]
+                            combined_upper += ' ' + valid_parts_upper[j]
+                            if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                                 party1 = combined
                                 party2 = combined
                                 break
@@ -5,7 +5,7 @@ Base parser class for bank statement processing
 from abc import ABC, abstractmethod
 import pandas as pd
 from typing import Dict, List, Tuple, Optional
-from config import BANK_KEYWORDS, PAYMENT_CATEGORY_MAP
+from config import BANK_KEYWORDS_RE, PAYMENT_CATEGORY_MAP
 from utils import (
     is_valid_party_name, clean_party_name, clean_amount, 
     format_date, determine_debit_credit, split_transaction_description
@@ -24,7 +24,7 @@ class BaseBankParser(ABC):
         pass
     
     @abstractmethod
-    def parse_transaction_description(self, description: str) -> pd.Series:
+    def parse_transaction_description(self, description: str) -> Tuple[str, str, str]:
         """Parse transaction description to extract payment category and party names"""
         pass
     
@@ -43,12 +43,13 @@ class BaseBankParser(ABC):
         party2 = ""
         
         for part in parts:
-            if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
+            if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(part.upper()):
                 party1 = part
                 party2 = part
                 break
-        
+
+        # Both names come from the same part, so clean once
         party1 = clean_party_name(party1)
-        party2 = clean_party_name(party2)
-        
+        party2 = party1
+
         return party1, party2
@@ -3,17 +3,82 @@ ICICI Bank parser for both yearly and monthly formats
 """
 
 import pandas as pd
+import numpy as np
 import re
+from functools import lru_cache
 from typing import Tuple
 from parsers.base_parser import BaseBankParser
-from config import ICICI_YEARLY_COLUMNS, ICICI_MONTHLY_COLUMNS, HEADER_ROWS, BANK_KEYWORDS
+from config import (
+    ICICI_YEARLY_COLUMNS, ICICI_MONTHLY_COLUMNS, HEADER_ROWS, BANK_KEYWORDS_RE,
+    PAYMENT_CATEGORY_MAP
+)
 from utils import (
-    is_valid_party_name, clean_party_name, clean_amount, 
-    format_date, determine_debit_credit, determine_debit_credit_from_cr_dr,
-    split_transaction_description, read_excel_file, add_remark_column
+    is_valid_party_name, clean_party_name, format_date_column,
+    split_transaction_description, read_excel_file, add_remark_column,
+    clean_amount_column
 )
 
 
+# Reference-code checks run dozens of times per transaction; defined at
+# module level so they are created once, not per extraction call
+def _is_reference_code(part: str) -> bool:
+    """Check if a part looks like a reference code (not a party name)
+
+    A single pass accumulates the character counts every rule needs, so
+    each candidate string is walked once instead of once per rule.
+    """
+    part_clean = part.strip()
+    # Very short codes (1-3 chars)
+    if len(part_clean) <= 3:
+        return True
+    n_digits = n_other = 0
+    for c in part_clean:
+        if c.isdigit():
+            n_digits += 1
+        elif not c.isalnum():
+            n_other += 1
+    # All digits
+    if n_digits == len(part_clean):
+        return True
+    # Long alphanumeric codes (like 61SDcgKgGU5RB7VpmKzIWe786286)
+    if len(part_clean) > 15 and n_other == 0:
+        return True
+    return False
+
+
+def _looks_like_reference_code(name: str) -> bool:
+    """Check if name looks like a reference code rather than a party name
+
+    Like _is_reference_code, this counts digits/spaces/special characters
+    in one pass instead of running isdigit/isalnum plus a comprehension
+    over the same string.
+    """
+    if not name or len(name) < 3:
+        return True
+    name_clean = name.strip()
+    # Very short codes
+    if len(name_clean) <= 3:
+        return True
+    n_digits = n_spaces = n_special = 0
+    for c in name_clean:
+        if c.isdigit():
+            n_digits += 1
+        elif c == ' ':
+            n_spaces += 1
+        elif not c.isalnum():
+            n_special += 1
+    # All digits
+    if n_digits == len(name_clean):
+        return True
+    # Long alphanumeric codes
+    if len(name_clean) > 15 and n_spaces == 0 and n_special == 0:
+        return True
+    # Contains many special characters or looks like a hash
+    if n_special > len(name_clean) * 0.3:
+        return True
+    return False
+
+
 class ICICIParser(BaseBankParser):
     """Parser for ICICI Bank statements (both yearly and monthly formats)"""
     
@@ -26,21 +91,42 @@ class ICICIParser(BaseBankParser):
     
     def process_file(self, file_path: str) -> pd.DataFrame:
         """Process ICICI bank statement file"""
-        # Read Excel file (supports both .xls and .xlsx)
-        df = read_excel_file(file_path, header=None, skiprows=self.header_row + 1, dtype=str)
+        # Read Excel file (supports both .xls and .xlsx). The format
+        # declares a fixed schema, so only read that many columns and
+        # never materialize stray trailing ones; names= applies the
+        # schema at read time. The pandas engines reject out-of-bounds
+        # usecols on a too-narrow sheet before the count check below
+        # can run, so surface that as the parser's wrong-format error,
+        # re-reading without the schema to report the real width.
+        try:
+            df = read_excel_file(file_path, header=None, skiprows=self.header_row + 1,
+                                 dtype=str, usecols=range(len(self.columns)),
+                                 names=self.columns)
+        except pd.errors.ParserError:
+            df = read_excel_file(file_path, header=None,
+                                 skiprows=self.header_row + 1, dtype=str)
+            raise ValueError(f"Expected {len(self.columns)} columns but got {len(df.columns)}. "
+                           f"Please check if this is the correct {self.bank_name} format.")
         df = self.clean_dataframe(df)
-        
+
         # Check if we have the right number of columns
         if len(df.columns) != len(self.columns):
             raise ValueError(f"Expected {len(self.columns)} columns but got {len(df.columns)}. "
                            f"Please check if this is the correct {self.bank_name} format.")
-        
-        # Set column names
+
+        # Ensure the schema is applied even on paths that read positionally
         df.columns = self.columns
-        
-        # Replace hyphens with slashes for uniformity
+
+        # The description column (and Cr/Dr for monthly) feed every .str
+        # pass below; Arrow-backed strings run those through compiled
+        # kernels instead of per-element Python calls
         description_col = "Description" if self.is_monthly else "Transaction Remarks"
-        df[description_col] = df[description_col].astype(str).str.replace("-", "/", regex=False)
+        df[description_col] = df[description_col].astype('string[pyarrow]')
+        if self.is_monthly:
+            df["Cr/Dr"] = df["Cr/Dr"].astype('string[pyarrow]')
+
+        # Replace hyphens with slashes for uniformity
+        df[description_col] = df[description_col].str.replace("-", "/", regex=False)
         
         # Format dates
         if self.is_monthly:
@@ -48,120 +134,165 @@ class ICICIParser(BaseBankParser):
         else:
             date_cols = ["Value Date", "Transaction Date", "Transaction Posted Date and time"]
         
+        # One vectorized parse/format pass per column instead of a
+        # Python call per cell; format='mixed' inside the helper keeps
+        # the per-element parsing the scalar version had
         for col in date_cols:
             if col in df.columns:
-                df[col] = df[col].apply(format_date)
+                df[col] = format_date_column(df[col])
         
-        # Determine Debit/Credit
+        # Determine Debit/Credit in vectorized passes instead of a
+        # Python call per row
         if self.is_monthly:
-            df["Debit/Credit"] = df["Cr/Dr"].apply(determine_debit_credit_from_cr_dr)
+            # Cr/Dr maps straight onto the label (already string dtype)
+            crdr = df["Cr/Dr"].str.strip().str.upper()
+            df["Debit/Credit"] = crdr.map({"CR": "Credit", "DR": "Debit"}).fillna("")
         else:
-            df["Debit/Credit"] = df.apply(
-                lambda row: determine_debit_credit(row["Withdrawal Amt (INR)"], row["Deposit Amt (INR)"]), 
-                axis=1
+            # Deposit wins over withdrawal, like determine_debit_credit
+            withdrawal = clean_amount_column(df["Withdrawal Amt (INR)"])
+            deposit = clean_amount_column(df["Deposit Amt (INR)"])
+            df["Debit/Credit"] = np.where(
+                ~deposit.isin(["", "0", "0.0"]), "Credit",
+                np.where(~withdrawal.isin(["", "0", "0.0"]), "Debit", "")
             )
         
-        # Parse Payment Category & Party Names
-        df[["Payment Category", "Party Name1", "Party Name2"]] = df[description_col].apply(
-            self.parse_transaction_description
-        )
+        # Parse Party Names for each unique description only, then
+        # broadcast the results back with two Series.map passes - the
+        # per-row extraction work scales with unique descriptions
+        # instead of total rows. Separate dicts per output column skip
+        # the tuple unpack during the map.
+        descriptions = df[description_col].fillna("")
+        party1_map = {}
+        party2_map = {}
+        for desc in pd.unique(descriptions):
+            party1, party2 = self._extract_parties_cached(desc)
+            party1_map[desc] = party1
+            party2_map[desc] = party2
+        df["Party Name1"] = descriptions.map(party1_map)
+        df["Party Name2"] = descriptions.map(party2_map)
+
+        # Payment Category depends only on the leading token, so derive
+        # it in vectorized passes: pull the token, map it through
+        # PAYMENT_CATEGORY_MAP, and fall back to the token itself for
+        # unknown types (matching get_payment_category)
+        token = (df[description_col].str.split("/", n=1).str[0]
+                 .str.strip().str.upper().fillna(""))
+        category = token.map(PAYMENT_CATEGORY_MAP)
+        df["Payment Category"] = category.where(category.notna(), token)
+        df.loc[token.str.startswith("REJECT"), "Payment Category"] = "REJECT"
         
         # Validate cash transactions based on debit/credit
         # Credit + Cash = CASH DEPOSIT, Debit + Cash = CASH WITHDRAWAL
-        cash_mask = df["Payment Category"].str.contains("CASH", case=False, na=False)
-        df.loc[cash_mask & (df["Debit/Credit"] == "Credit"), "Payment Category"] = "CASH DEPOSIT"
-        df.loc[cash_mask & (df["Debit/Credit"] == "Debit"), "Payment Category"] = "CASH WITHDRAWAL"
-        
-        # For monthly format, create Withdrawal/Deposit columns
+        # Scatter-write through plain numpy arrays - no pandas index
+        # bookkeeping on the two masked assignments. Rows without a
+        # direction keep their original category.
+        cash_mask = df["Payment Category"].str.contains("CASH", case=False, na=False).to_numpy()
+        direction = df["Debit/Credit"].to_numpy()
+        payment_category = df["Payment Category"].to_numpy(copy=True)
+        payment_category[cash_mask & (direction == "Credit")] = "CASH DEPOSIT"
+        payment_category[cash_mask & (direction == "Debit")] = "CASH WITHDRAWAL"
+        df["Payment Category"] = payment_category
+        
+        # For monthly format, create Withdrawal/Deposit columns by
+        # splitting the cleaned amount on the direction mask - two
+        # np.where passes instead of a Python call per row
         if self.is_monthly:
-            df[["Withdrawal Amt (INR)", "Deposit Amt (INR)"]] = df.apply(
-                self._get_withdrawal_deposit_monthly, axis=1
-            )
+            amount = clean_amount_column(df["Transaction Amount(INR)"])
+            df["Withdrawal Amt (INR)"] = np.where(df["Debit/Credit"] == "Debit", amount, "0")
+            df["Deposit Amt (INR)"] = np.where(df["Debit/Credit"] == "Credit", amount, "0")
         
         # Add Remark column using strict rule-based classification
-        description_col = "Description" if self.is_monthly else "Transaction Remarks"
         df = add_remark_column(df, description_col, "Payment Category")
-        
+
+        # The label columns draw from a small vocabulary; category dtype
+        # keeps int codes plus a dictionary instead of a str per row.
+        # Cast last, after every .loc fixup has finished writing labels.
+        for col in ("Debit/Credit", "Payment Category"):
+            df[col] = df[col].astype("category")
+
         return self._reorder_columns(df)
     
-    def parse_transaction_description(self, description: str) -> pd.Series:
+    def parse_transaction_description(self, description: str) -> Tuple[str, str, str]:
         """Parse ICICI transaction description"""
         if pd.isna(description) or description.strip() == "":
-            return pd.Series(["", "", ""])
-        
-        parts = split_transaction_description(description)
+            return "", "", ""
+
+        # Only the leading token is inspected here, so cap the split
+        # rather than materializing every fragment of a noisy description
+        parts = split_transaction_description(description, maxsplit=6)
         if not parts:
-            return pd.Series(["", "", ""])
-        
+            return "", "", ""
+
         # Handle REJECT transactions
         if parts[0].upper().startswith("REJECT"):
-            return pd.Series(["REJECT", "", ""])
-        
+            return "REJECT", "", ""
+
+        txn_type = parts[0].upper()
+        party1, party2 = self._extract_parties_from_description(description)
+        # Direct dict lookup - same mapping get_payment_category wraps,
+        # minus the bound-method call per row
+        return PAYMENT_CATEGORY_MAP.get(txn_type, txn_type), party1, party2
+
+    def _extract_parties_from_description(self, description: str) -> Tuple[str, str]:
+        """Extract both party names from an ICICI transaction description"""
+        if pd.isna(description) or description.strip() == "":
+            return "", ""
+        return self._extract_parties_cached(description)
+
+    @lru_cache(maxsize=100_000)
+    def _extract_parties_cached(self, description: str) -> Tuple[str, str]:
+        """Memoized party extraction keyed on the raw description
+
+        Statements repeat descriptions heavily (standing instructions,
+        recurring merchants), so each unique string is parsed once and
+        duplicates cost a dict lookup.
+        """
+        return self._extract_parties_from_parts(
+            split_transaction_description(description), description
+        )
+
+    def _extract_parties_from_parts(self, parts: list, description: str) -> Tuple[str, str]:
+        """Extract both party names from a pre-split description"""
+        if not parts:
+            return "", ""
+
         txn_type = parts[0].upper()
+        if txn_type.startswith("REJECT"):
+            return "", ""
+
         party1 = ""
         party2 = ""
-        
-        # INF/INFT Transactions
-        if txn_type in ["INF", "INFT"]:
-            party1, party2 = self._parse_inf_transaction(parts)
-        
-        # TRF Transactions
-        elif txn_type == "TRF":
-            party1, party2 = self._parse_trf_transaction(parts)
-        
-        # Cheque clearing
-        elif txn_type == "CLG":
-            party1, party2 = self._parse_clg_transaction(parts)
-        
-        # Cash deposits
+
+        # Dispatch on the leading token through the handler table; CASH
+        # is a containment match, so it keeps an explicit branch
+        handler = self._PARTY_DISPATCH.get(txn_type)
+        if handler is not None:
+            if txn_type == "MMT":
+                party1, party2 = handler(self, parts, description)
+            else:
+                party1, party2 = handler(self, parts)
         elif "CASH" in txn_type:
             party1, party2 = self._parse_cash_transaction(parts)
         
-        # MMT/IMPS Transactions
-        elif txn_type == "MMT":
-            party1, party2 = self._parse_mmt_transaction(parts, description)
-        
-        # NEFT, RTGS, IMPS, CMS
-        elif txn_type in ["NEFT", "RTGS", "IMPS", "CMS"]:
-            party1, party2 = self._parse_standard_transaction(parts)
-        
-        # Clean party names
-        party1 = clean_party_name(party1)
-        party2 = clean_party_name(party2)
-        
-        # If party1 looks like a reference code or invalid, use party2 or try to extract better name
-        def looks_like_reference_code(name: str) -> bool:
-            """Check if name looks like a reference code rather than a party name"""
-            if not name or len(name) < 3:
-                return True
-            name_clean = name.strip()
-            # All digits
-            if name_clean.isdigit():
-                return True
-            # Long alphanumeric codes
-            if len(name_clean) > 15 and name_clean.isalnum():
-                return True
-            # Very short codes
-            if len(name_clean) <= 3:
-                return True
-            # Contains many special characters or looks like a hash
-            if len([c for c in name_clean if not c.isalnum() and c != ' ']) > len(name_clean) * 0.3:
-                return True
-            return False
+        # Clean party names. party2 mirrors party1 for most transaction
+        # types, so skip the second cleaning pass when they match.
+        cleaned1 = clean_party_name(party1)
+        party2 = cleaned1 if party2 == party1 else clean_party_name(party2)
+        party1 = cleaned1
         
         # If party1 is invalid, try to use party2 or extract from description again
-        if looks_like_reference_code(party1) or not is_valid_party_name(party1):
-            if party2 and not looks_like_reference_code(party2) and is_valid_party_name(party2):
+        if _looks_like_reference_code(party1) or not is_valid_party_name(party1):
+            if party2 and not _looks_like_reference_code(party2) and is_valid_party_name(party2):
                 # Use party2 as party1
                 party1 = party2
-            elif not party1 or looks_like_reference_code(party1):
+            elif not party1 or _looks_like_reference_code(party1):
                 # Try to extract a better name from the description
                 # Look for parts that might be party names
                 for i in range(len(parts) - 1, 0, -1):  # Start from end
                     part = parts[i].strip()
-                    if part and not looks_like_reference_code(part):
-                        if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
-                            if not party1 or looks_like_reference_code(party1):
+                    if part and not _looks_like_reference_code(part):
+                        if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(part.upper()):
+                            if not party1 or _looks_like_reference_code(party1):
                                 party1 = part
                                 if not party2:
                                     party2 = part
@@ -173,10 +304,7 @@ class ICICIParser(BaseBankParser):
         elif party2 and not party1:
             party1 = party2
         
-        # Get payment category
-        payment_category = self.get_payment_category(txn_type)
-        
-        return pd.Series([payment_category, party1, party2])
+        return party1, party2
     
     def _parse_inf_transaction(self, parts: list) -> Tuple[str, str]:
         """Parse INF/INFT transaction"""
@@ -184,28 +312,14 @@ class ICICIParser(BaseBankParser):
         # INF/INFT/REFERENCE1/REFERENCE2/PARTY_NAME
         # INF/INFT/REFERENCE/PARTIAL_NAME/PARTY_NAME
         # INF/NEFT/REFERENCE/BANKCODE/PARTYNAME
-        
-        def is_reference_code(part: str) -> bool:
-            """Check if a part looks like a reference code (not a party name)"""
-            part_clean = part.strip()
-            # All digits
-            if part_clean.isdigit():
-                return True
-            # Long alphanumeric codes (like 61SDcgKgGU5RB7VpmKzIWe786286)
-            if len(part_clean) > 15 and part_clean.isalnum():
-                return True
-            # Very short codes (1-3 chars)
-            if len(part_clean) <= 3:
-                return True
-            return False
-        
+
         if len(parts) >= 2 and parts[1] in ["NEFT", "RTGS", "IMPS"]:
             # Format: INF/NEFT/REFERENCE/BANKCODE/PARTYNAME
             # Skip transaction type and bank codes, look for party name from index 3 onwards
             for i in range(3, len(parts)):
                 potential_party = parts[i].strip()
-                if potential_party and not is_reference_code(potential_party):
-                    if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
+                if potential_party and not _is_reference_code(potential_party):
+                    if is_valid_party_name(potential_party) and not BANK_KEYWORDS_RE.search(potential_party.upper()):
                         return potential_party, potential_party
             
             # Try combining parts if single parts don't work
@@ -213,15 +327,16 @@ class ICICIParser(BaseBankParser):
                 party_parts = []
                 for i in range(3, len(parts)):
                     part = parts[i].strip()
-                    if part and not is_reference_code(part):
+                    if part and not _is_reference_code(part):
                         party_parts.append(part)
-                
+
                 if party_parts:
-                    # Try all combinations
+                    # Try all combinations, uppercasing each part once
+                    party_parts_upper = [p.upper() for p in party_parts]
                     for i in range(len(party_parts)):
                         for j in range(i+1, min(len(party_parts), i+3)):
                             combined = ' '.join(party_parts[i:j+1])
-                            if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                            if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(' '.join(party_parts_upper[i:j+1])):
                                 return combined, combined
         else:
             # Format: INF/INFT/REFERENCE1/REFERENCE2/PARTY_NAME or INF/INFT/REFERENCE/PARTIAL/PARTY_NAME
@@ -236,11 +351,11 @@ class ICICIParser(BaseBankParser):
                     continue
                 
                 # If we hit a reference code, we've likely passed the party name
-                if is_reference_code(part):
+                if _is_reference_code(part):
                     break
                 
                 # Check if it looks like a party name
-                if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
+                if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(part.upper()):
                     party_parts.insert(0, part)  # Insert at beginning to maintain order
                 elif len(part) >= 4 and not part.isdigit() and any(c.isalpha() for c in part):
                     # Might be a partial party name, include it
@@ -249,12 +364,12 @@ class ICICIParser(BaseBankParser):
             # If we found party parts, use them
             if party_parts:
                 # Try the last part first (most likely to be complete)
-                if is_valid_party_name(party_parts[-1]) and not any(bank in party_parts[-1].upper() for bank in BANK_KEYWORDS):
+                if is_valid_party_name(party_parts[-1]) and not BANK_KEYWORDS_RE.search(party_parts[-1].upper()):
                     return party_parts[-1], party_parts[-1]
                 
                 # Try combining all collected parts
                 combined = ' '.join(party_parts)
-                if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined.upper()):
                     return combined, combined
                 
                 # If combined doesn't validate but looks reasonable, return it anyway
@@ -264,18 +379,19 @@ class ICICIParser(BaseBankParser):
             # Fallback: Try forward search from index 2
             for i in range(2, len(parts)):
                 potential_party = parts[i].strip()
-                if potential_party and not is_reference_code(potential_party):
-                    if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
+                if potential_party and not _is_reference_code(potential_party):
+                    if is_valid_party_name(potential_party) and not BANK_KEYWORDS_RE.search(potential_party.upper()):
                         return potential_party, potential_party
             
             # Try combining parts forward
             if len(parts) >= 3:
-                valid_parts = [p.strip() for p in parts[2:] if p.strip() and not is_reference_code(p.strip())]
+                valid_parts = [p.strip() for p in parts[2:] if p.strip() and not _is_reference_code(p.strip())]
                 if valid_parts:
+                    valid_parts_upper = [p.upper() for p in valid_parts]
                     for i in range(len(valid_parts)):
                         for j in range(i+1, min(len(valid_parts), i+3)):
                             combined = ' '.join(valid_parts[i:j+1])
-                            if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                            if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(' '.join(valid_parts_upper[i:j+1])):
                                 return combined, combined
                     
                     # Last resort: return the last valid part if it looks reasonable
@@ -284,22 +400,35 @@ class ICICIParser(BaseBankParser):
         
         return "", ""
     
-    def _parse_trf_transaction(self, parts: list) -> Tuple[str, str]:
-        """Parse TRF transaction"""
-        # Format: TRF/PARTY_NAME or TRF/REFERENCE/PARTY_NAME
-        for i in range(1, len(parts)):
-            potential_party = parts[i]
-            if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
-                return potential_party, potential_party
-        
-        # Try combining parts
-        if len(parts) >= 2:
-            for i in range(1, min(len(parts), 4)):
+    def _find_party(self, parts: list, start: int, scan_limit: int = 5,
+                    combine: bool = True) -> Tuple[str, str]:
+        """Scan parts[start:] for the first valid non-bank party name
+
+        Single parts are tried first; if none validate, two- and
+        three-part combinations starting before scan_limit are tried.
+        This is the common core of the TRF/CASH/MMT/standard handlers.
+        """
+        # Uppercase each part once up front; the combination pass below
+        # would otherwise re-uppercase the same parts for every pairing
+        parts_upper = [p.upper() for p in parts]
+
+        for i in range(start, len(parts)):
+            part = parts[i]
+            if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(parts_upper[i]):
+                return part, part
+
+        if combine:
+            for i in range(start, min(len(parts), scan_limit)):
                 for j in range(i+1, min(len(parts), i+3)):
                     combined = ' '.join(parts[i:j+1])
-                    if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                    if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(' '.join(parts_upper[i:j+1])):
                         return combined, combined
         return "", ""
+
+    def _parse_trf_transaction(self, parts: list) -> Tuple[str, str]:
+        """Parse TRF transaction"""
+        # Format: TRF/PARTY_NAME or TRF/REFERENCE/PARTY_NAME
+        return self._find_party(parts, start=1, scan_limit=4)
     
     def _parse_clg_transaction(self, parts: list) -> Tuple[str, str]:
         """Parse CLG (cheque clearing) transaction"""
@@ -310,7 +439,7 @@ class ICICIParser(BaseBankParser):
             
             # Party name might be a single word or multi-word (e.g., "VICKY AGARWAL", "ROYAL MART")
             # First validate the party name at index 1
-            if is_valid_party_name(party_name) and not any(bank in party_name.upper() for bank in BANK_KEYWORDS):
+            if is_valid_party_name(party_name) and not BANK_KEYWORDS_RE.search(party_name.upper()):
                 return party_name, party_name
             
             # If validation fails, check if it's because it's a multi-word name that needs checking
@@ -324,11 +453,11 @@ class ICICIParser(BaseBankParser):
                         words = party_name.split()
                         # If all words are reasonable length and contain letters
                         if all(len(word) >= 2 and any(c.isalpha() for c in word) for word in words):
-                            if not any(bank in party_name.upper() for bank in BANK_KEYWORDS):
+                            if not BANK_KEYWORDS_RE.search(party_name.upper()):
                                 return party_name, party_name
                     else:
                         # Single word - return if it's reasonable
-                        if not any(bank in party_name.upper() for bank in BANK_KEYWORDS):
+                        if not BANK_KEYWORDS_RE.search(party_name.upper()):
                             return party_name, party_name
             
             # If index 1 doesn't work, try combining index 1 with index 2 (in case party name spans multiple parts)
@@ -341,7 +470,7 @@ class ICICIParser(BaseBankParser):
                 if not is_cheque_or_code:
                     # Try combining
                     combined = f"{party_name} {next_part}"
-                    if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                    if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined.upper()):
                         return combined, combined
         
         return "", ""
@@ -349,91 +478,61 @@ class ICICIParser(BaseBankParser):
     def _parse_cash_transaction(self, parts: list) -> Tuple[str, str]:
         """Parse cash deposit transaction"""
         # Cash transactions usually don't have party names, but try to extract if available
-        for i in range(1, len(parts)):
-            potential_party = parts[i]
-            if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
-                return potential_party, potential_party
-        return "", ""
-    
+        return self._find_party(parts, start=1, combine=False)
+
     def _parse_mmt_transaction(self, parts: list, description: str) -> Tuple[str, str]:
         """Parse MMT transaction"""
-        # Handle MMT/IMPS format specifically
+        # Handle MMT/IMPS format specifically. parts came from
+        # split_transaction_description(description) at the caller, so
+        # re-splitting here would just rebuild the same list.
         if "IMPS" in description.upper():
-            imps_parts = split_transaction_description(description)
-            for i in range(len(imps_parts)):
-                part = imps_parts[i]
-                if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
-                    return part, part
-            
-            # Try combining parts
-            for i in range(len(imps_parts)):
-                for j in range(i+1, min(len(imps_parts), i+3)):
-                    combined = ' '.join(imps_parts[i:j+1])
-                    if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
-                        return combined, combined
-        
+            party1, party2 = self._find_party(parts, start=0,
+                                              scan_limit=len(parts))
+            if party1:
+                return party1, party2
+
         # If no party found in MMT/IMPS, use the original logic
-        for i in range(2, len(parts)):
-            current_part = parts[i]
-            if is_valid_party_name(current_part) and not any(bank in current_part.upper() for bank in BANK_KEYWORDS):
-                return current_part, current_part
-        
-        # Try combining parts
-        if len(parts) >= 3:
-            for i in range(2, min(len(parts), 5)):
-                for j in range(i+1, min(len(parts), i+3)):
-                    combined = ' '.join(parts[i:j+1])
-                    if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
-                        return combined, combined
-        
-        return "", ""
-    
+        return self._find_party(parts, start=2)
+
     def _parse_standard_transaction(self, parts: list) -> Tuple[str, str]:
         """Parse standard transactions (NEFT, RTGS, IMPS, CMS)"""
         # Format: TXN_TYPE/BANKCODE/REFERENCE/PARTY_NAME or TXN_TYPE/PARTY_NAME/...
         # Skip first part (transaction type) and try to find party name
-        for i in range(1, len(parts)):
-            current_part = parts[i]
-            if is_valid_party_name(current_part) and not any(bank in current_part.upper() for bank in BANK_KEYWORDS):
-                return current_part, current_part
-        
-        # Try combining parts if single parts don't work (for multi-word party names)
-        if len(parts) >= 3:
-            for i in range(1, min(len(parts), 5)):  # Check up to 5 parts
-                for j in range(i+1, min(len(parts), i+3)):  # Combine up to 3 words
-                    combined = ' '.join(parts[i:j+1])
-                    if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
-                        return combined, combined
-        return "", ""
-    
-    def _get_withdrawal_deposit_monthly(self, row) -> pd.Series:
-        """Get withdrawal/deposit amounts for monthly format"""
-        amount_str = str(row["Transaction Amount(INR)"]).strip()
-        amount = clean_amount(amount_str)
-        
-        if row["Debit/Credit"] == "Debit":
-            return pd.Series([amount, "0"])
-        elif row["Debit/Credit"] == "Credit":
-            return pd.Series(["0", amount])
-        else:
-            return pd.Series(["0", "0"])
-    
+        return self._find_party(parts, start=1)
+
+    # Party-extraction handlers keyed by the exact leading token. MMT is
+    # the one handler that also needs the raw description.
+    _PARTY_DISPATCH = {
+        "INF": _parse_inf_transaction,
+        "INFT": _parse_inf_transaction,
+        "TRF": _parse_trf_transaction,
+        "CLG": _parse_clg_transaction,
+        "MMT": _parse_mmt_transaction,
+        "NEFT": _parse_standard_transaction,
+        "RTGS": _parse_standard_transaction,
+        "IMPS": _parse_standard_transaction,
+        "CMS": _parse_standard_transaction,
+    }
+
+    # Output column orders, built once per class instead of per call
+    _MONTHLY_COLS_ORDER = (
+        "No.", "Transaction ID", "Value Date", "Txn Posted Date", "ChequeNo.",
+        "Description", "Withdrawal Amt (INR)", "Deposit Amt (INR)",
+        "Available Balance(INR)", "Debit/Credit", "Payment Category",
+        "Party Name1", "Party Name2", "Remark"
+    )
+    _YEARLY_COLS_ORDER = (
+        "S.N.", "Tran. Id", "Value Date", "Transaction Date",
+        "Transaction Posted Date and time", "Cheque. No./Ref. No.",
+        "Transaction Remarks", "Withdrawal Amt (INR)", "Deposit Amt (INR)",
+        "Balance (INR)", "Debit/Credit", "Payment Category",
+        "Party Name1", "Party Name2", "Remark"
+    )
+
     def _reorder_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Reorder columns based on format"""
-        if self.is_monthly:
-            cols_order = [
-                "No.", "Transaction ID", "Value Date", "Txn Posted Date", "ChequeNo.",
-                "Description", "Withdrawal Amt (INR)", "Deposit Amt (INR)", 
-                "Available Balance(INR)", "Debit/Credit", "Payment Category", 
-                "Party Name1", "Party Name2", "Remark"
-            ]
-        else:
-            cols_order = [
-                "S.N.", "Tran. Id", "Value Date", "Transaction Date", 
-                "Transaction Posted Date and time", "Cheque. No./Ref. No.",
-                "Transaction Remarks", "Withdrawal Amt (INR)", "Deposit Amt (INR)",
-                "Balance (INR)", "Debit/Credit", "Payment Category", 
-                "Party Name1", "Party Name2", "Remark"
-            ]
-        
-        return df[[c for c in cols_order if c in df.columns]]
+        cols_order = self._MONTHLY_COLS_ORDER if self.is_monthly else self._YEARLY_COLS_ORDER
+        # One membership structure for the filter; the selection itself
+        # is a lazy view under copy-on-write
+        present = df.columns.intersection(cols_order, sort=False)
+        return df[[c for c in cols_order if c in present]]
@@ -3,19 +3,41 @@ Jana Bank parser
 """
 
 import pandas as pd
+import numpy as np
 import re
 from typing import Tuple, Dict
 from parsers.base_parser import BaseBankParser
-from config import JANA_COLUMN_PATTERNS, HEADER_ROWS, BANK_KEYWORDS
+from config import JANA_COLUMN_RES, HEADER_ROWS, BANK_KEYWORDS_RE
 from utils import (
-    is_valid_party_name, clean_party_name, clean_amount, 
-    format_date, determine_debit_credit, split_transaction_description, read_excel_file,
-    add_remark_column
+    is_valid_party_name, clean_party_name, clean_amount_column,
+    format_date_column, determine_debit_credit, split_transaction_description,
+    read_excel_file, add_remark_column
 )
 
 
+
+# Token-shape checks used inside the party-extraction loops; compiled
+# once at import instead of re.match with a literal pattern per word
+_DIGITS_RE = re.compile(r'^\d+$')
+_NUM_PREFIX_RE = re.compile(r'^\d+-')
+_DATE8_RE = re.compile(r'^\d{8}$')
+_BANKCODE_RE = re.compile(r'^[A-Z]{3,4}\d+$')
+
+# Word blacklists for the party-extraction loops; frozensets give
+# hashed membership instead of a list scan per word per row
+_GENERIC_WORDS = frozenset({'OTHER', 'TRANSACTION', 'PAYMENT', 'BANK'})
+_IMPS_STOPWORDS = frozenset({'PAYMENT', 'AGAINST', 'FOR', 'TO', 'FROM', 'REF', 'REFERENCE', 'ID'})
+
+
 class JanaParser(BaseBankParser):
     """Parser for Jana Bank statements"""
+
+    # Output schema produced by _process_row
+    OUTPUT_COLUMNS = (
+        'S.N.', 'Transaction Date', 'Value Date', 'Description', 'Reference No',
+        'Withdrawal Amt (INR)', 'Deposit Amt (INR)', 'Balance (INR)', 'Debit/Credit',
+        'Payment Category', 'Party Name1', 'Party Name2'
+    )
     
     def __init__(self):
         super().__init__("Jana Bank")
@@ -31,29 +53,101 @@ class JanaParser(BaseBankParser):
             # Clean column names
             df.columns = [str(col).strip() for col in df.columns]
             
-            # Map columns
+            # Map columns and resolve them to tuple positions once, so
+            # the row loop can run over plain tuples instead of
+            # materializing a Series per row
             column_mapping = self._map_columns(df.columns)
-            
-            # Process data
-            processed_data = []
-            for idx, row in df.iterrows():
-                if pd.isna(row.get(column_mapping.get('Description', ''))):
-                    continue
-                
-                processed_row = self._process_row(row, column_mapping)
-                if processed_row:
-                    processed_data.append(processed_row)
-            
-            df = pd.DataFrame(processed_data)
-            
-            # Keep only essential columns
-            essential_cols = [
-                'S.N.', 'Transaction Date', 'Value Date', 'Description', 'Reference No',
-                'Withdrawal Amt (INR)', 'Deposit Amt (INR)', 'Balance (INR)', 'Debit/Credit', 
-                'Payment Category', 'Party Name1', 'Party Name2'
-            ]
-            df = df[[col for col in essential_cols if col in df.columns]]
-            
+            cols = self._resolve_column_positions(df.columns, column_mapping)
+
+            # Process data. Accumulate per-column lists instead of a
+            # list of row dicts so pd.DataFrame builds each column in
+            # one shot rather than unifying dtypes row by row. The dict
+            # also fixes the output schema, replacing the old
+            # essential-columns reprojection (and its column copies).
+            out_columns = {col: [] for col in self.OUTPUT_COLUMNS}
+            desc_idx = cols['description']
+            if desc_idx is not None:
+                # Classify the whole description column in one
+                # vectorized pass; the loop just indexes the result.
+                # Arrow-backed strings keep the many substring scans in
+                # contiguous buffers with C string kernels.
+                categories = self._classify_descriptions(
+                    df.iloc[:, desc_idx].astype('string[pyarrow]'))
+
+                # Parse and format both date columns in one vectorized
+                # pass each instead of a Python call per row
+                dates = {
+                    idx: format_date_column(df.iloc[:, idx]).tolist()
+                    for idx in (cols['transaction_date'], cols['value_date'])
+                    if idx is not None
+                }
+
+                # Clean the amount and balance columns the same way -
+                # one vectorized scrub per column instead of a clean_amount
+                # call per cell
+                amounts = {
+                    idx: clean_amount_column(df.iloc[:, idx]).tolist()
+                    for idx in (cols['amount'], cols['balance'])
+                    if idx is not None
+                }
+
+                # Strip the raw text columns once, column-wide, instead
+                # of str(...).strip() per cell in the row loop. fillna
+                # with the str() spellings keeps missing cells rendering
+                # exactly as the per-row conversions did.
+                texts = {
+                    idx: df.iloc[:, idx].fillna('nan').astype(str).str.strip().tolist()
+                    for idx in (cols['description'], cols['ref'])
+                    if idx is not None
+                }
+                if cols['sn'] is not None:
+                    texts[cols['sn']] = df.iloc[:, cols['sn']].fillna('nan').astype(str).tolist()
+
+                # Map Dr/Cr onto the Debit/Credit label and split the
+                # amount into withdrawal/deposit in vectorized passes
+                n_rows = len(df)
+                if cols['drcr'] is not None:
+                    crdr = df.iloc[:, cols['drcr']].astype('string[pyarrow]').str.strip().str.upper()
+                    direction = crdr.map({'C': 'Credit', 'D': 'Debit'}).fillna('').to_numpy()
+                else:
+                    direction = np.full(n_rows, '', dtype=object)
+                if cols['amount'] is not None:
+                    amt_arr = np.asarray(amounts[cols['amount']], dtype=object)
+                else:
+                    amt_arr = np.full(n_rows, '0', dtype=object)
+                dc_split = (
+                    direction,
+                    np.where(direction == 'Debit', amt_arr, '0'),
+                    np.where(direction == 'Credit', amt_arr, '0'),
+                )
+
+                # Validate cash transactions against the direction:
+                # Credit + Cash = CASH DEPOSIT, Debit + Cash = CASH WITHDRAWAL.
+                # Rows without a direction keep their original category.
+                is_cash = np.char.startswith(categories.astype(str), 'CASH')
+                categories = np.where(
+                    is_cash & (direction == 'Credit'), 'CASH DEPOSIT',
+                    np.where(is_cash & (direction == 'Debit'), 'CASH WITHDRAWAL', categories)
+                )
+
+                # Statements repeat the same description many times
+                # (salary lines, recurring merchants), so party
+                # extraction runs once per unique (description,
+                # category) pair and repeats hit this cache
+                party_cache = {}
+                for pos, values in enumerate(df.itertuples(index=False, name=None)):
+                    if pd.isna(values[desc_idx]):
+                        continue
+
+                    processed_row = self._process_row(cols, categories[pos], texts,
+                                                      dates, amounts, dc_split, pos,
+                                                      party_cache)
+                    if processed_row:
+                        for col, out_values in out_columns.items():
+                            out_values.append(processed_row[col])
+
+            df = pd.DataFrame(out_columns)
+
             # Add Remark column using strict rule-based classification
             df = add_remark_column(df, "Description", "Payment Category")
             
@@ -62,41 +156,109 @@ class JanaParser(BaseBankParser):
         except Exception as e:
             raise Exception(f"Error processing Jana Bank statement: {e}")
     
-    def parse_transaction_description(self, description: str) -> pd.Series:
+    def parse_transaction_description(self, description: str) -> Tuple[str, str, str]:
         """Parse Jana Bank transaction description"""
         if pd.isna(description) or description.strip() == "":
-            return pd.Series(["", "", ""])
-        
+            return "", "", ""
+
         desc_clean = description.strip()
-        payment_category = ""
+        payment_category = self._classify_description(desc_clean)
+        party1, party2 = self._extract_parties(desc_clean, payment_category)
+        return payment_category, party1, party2
+
+    def _classify_description(self, desc_clean: str) -> str:
+        """Classify one description into a Payment Category"""
+        desc_upper = desc_clean.upper()
+        if 'NEFT CR' in desc_upper or (desc_upper.startswith('NEFT') and 'CR' in desc_upper):
+            return 'NEFT INCOMING'
+        if 'NEFT DR' in desc_upper or (desc_upper.startswith('NEFT') and 'DR' in desc_upper):
+            return 'NEFT OUTGOING'
+        if 'IMPS' in desc_upper:
+            return 'IMPS'
+        if 'RTGS' in desc_upper:
+            return 'RTGS'
+        if 'JANA CA TO JANA OD' in desc_upper:
+            if 'CR' in desc_upper:  # Credit to OD account
+                return 'INTERNAL TRANSFER CREDIT'
+            return 'INTERNAL TRANSFER DEBIT'
+        if 'CASH' in desc_upper:
+            if 'DEPOSIT' in desc_upper or 'CR' in desc_upper:
+                return 'CASH DEPOSIT'
+            return 'CASH WITHDRAWAL'
+        if 'CHQ' in desc_upper or 'CHEQUE' in desc_upper:
+            return 'CHEQUE'
+        return 'OTHER TRANSACTION'
+
+    def _classify_descriptions(self, descriptions: pd.Series) -> np.ndarray:
+        """Classify a whole description column in vectorized passes
+
+        Masks mirror _classify_description's branch chain; np.select
+        keeps the same first-match-wins precedence while each substring
+        scan runs once over the column instead of once per row.
+        """
+        u = descriptions.fillna('').str.strip().str.upper()
+        starts_neft = u.str.startswith('NEFT')
+        has_cr = u.str.contains('CR', regex=False)
+        m_neft_cr = u.str.contains('NEFT CR', regex=False) | (starts_neft & has_cr)
+        m_neft_dr = u.str.contains('NEFT DR', regex=False) | (starts_neft & u.str.contains('DR', regex=False))
+        m_imps = u.str.contains('IMPS', regex=False)
+        m_rtgs = u.str.contains('RTGS', regex=False)
+        m_internal = u.str.contains('JANA CA TO JANA OD', regex=False)
+        m_cash = u.str.contains('CASH', regex=False)
+        m_deposit = u.str.contains('DEPOSIT', regex=False) | has_cr
+        m_chq = u.str.contains('CHQ', regex=False) | u.str.contains('CHEQUE', regex=False)
+
+        return np.select(
+            [u == '',
+             m_neft_cr, m_neft_dr, m_imps, m_rtgs,
+             m_internal & has_cr, m_internal,
+             m_cash & m_deposit, m_cash,
+             m_chq],
+            ['',
+             'NEFT INCOMING', 'NEFT OUTGOING', 'IMPS', 'RTGS',
+             'INTERNAL TRANSFER CREDIT', 'INTERNAL TRANSFER DEBIT',
+             'CASH DEPOSIT', 'CASH WITHDRAWAL',
+             'CHEQUE'],
+            default='OTHER TRANSACTION'
+        )
+
+    def _extract_parties(self, desc_clean: str, payment_category: str) -> Tuple[str, str]:
+        """Extract party names from a description, given its category"""
         party1 = ""
         party2 = ""
-        
+
         # NEFT Credit Transactions - Format: NEFT CR-BANKCODE-PARTYNAME1-PARTYNAME2-REFERENCE
-        if 'NEFT CR' in desc_clean.upper() or (desc_clean.upper().startswith('NEFT') and 'CR' in desc_clean.upper()):
-            payment_category = 'NEFT INCOMING'
-            # Split by hyphen for NEFT CR transactions
+        if payment_category == 'NEFT INCOMING':
+            # Split by hyphen for NEFT CR transactions; strip and
+            # uppercase each part once instead of per loop iteration
             parts = desc_clean.split('-')
             if len(parts) >= 3:
+                stripped = [p.strip() for p in parts]
+                stripped_upper = [p.upper() for p in stripped]
                 # Skip first part (NEFT CR) and second part (bank code), party names are usually in middle parts
                 # Format: NEFT CR-BANKCODE-PARTYNAME1-PARTYNAME2-REFERENCE
                 potential_parties = []
                 for i in range(2, len(parts) - 1):  # Skip first 2 and last (which is usually reference)
-                    part = parts[i].strip()
-                    if part and is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
+                    part = stripped[i]
+                    if part and is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(stripped_upper[i]):
                         potential_parties.append(part)
-                
+
                 # Take the first valid party name as primary
                 if potential_parties:
                     party1 = potential_parties[0]
                     # If there's a second party name, use it, otherwise use the first one
                     party2 = potential_parties[1] if len(potential_parties) > 1 else potential_parties[0]
                 else:
-                    # Try combining parts if single parts don't work
+                    # Try combining parts if single parts don't work,
+                    # extending the span incrementally instead of
+                    # re-joining the slice for every (i, j) pair
                     for i in range(2, len(parts) - 1):
+                        combined = stripped[i]
+                        combined_upper = stripped_upper[i]
                         for j in range(i+1, min(len(parts) - 1, i+3)):
-                            combined = ' '.join([p.strip() for p in parts[i:j+1]])
-                            if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                            combined += ' ' + stripped[j]
+                            combined_upper += ' ' + stripped_upper[j]
+                            if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                                 party1 = combined
                                 party2 = combined
                                 break
@@ -104,23 +266,26 @@ class JanaParser(BaseBankParser):
                             break
         
         # NEFT Debit Transactions
-        elif 'NEFT DR' in desc_clean.upper() or (desc_clean.upper().startswith('NEFT') and 'DR' in desc_clean.upper()):
-            payment_category = 'NEFT OUTGOING'
+        elif payment_category == 'NEFT OUTGOING':
             # For NEFT DR transactions, format may vary, try to extract party name
             parts = desc_clean.split('-')
-            for part in parts:
-                part_clean = part.strip()
-                if is_valid_party_name(part_clean) and not any(bank in part_clean.upper() for bank in BANK_KEYWORDS):
+            stripped = [p.strip() for p in parts]
+            stripped_upper = [p.upper() for p in stripped]
+            for i, part_clean in enumerate(stripped):
+                if is_valid_party_name(part_clean) and not BANK_KEYWORDS_RE.search(stripped_upper[i]):
                     party1 = part_clean
                     party2 = part_clean
                     break
-            
+
             # Try combining parts if single parts don't work
             if not party1 and len(parts) >= 2:
                 for i in range(len(parts)):
+                    combined = stripped[i]
+                    combined_upper = stripped_upper[i]
                     for j in range(i+1, min(len(parts), i+3)):
-                        combined = ' '.join([p.strip() for p in parts[i:j+1]])
-                        if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                        combined += ' ' + stripped[j]
+                        combined_upper += ' ' + stripped_upper[j]
+                        if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                             party1 = combined
                             party2 = combined
                             break
@@ -128,8 +293,7 @@ class JanaParser(BaseBankParser):
                         break
         
         # IMPS Transactions - Format: IMPS REFERENCE PARTYNAME EXTRA INFO
-        elif 'IMPS' in desc_clean.upper():
-            payment_category = 'IMPS'
+        elif payment_category == 'IMPS':
             # Split by spaces
             words = desc_clean.split()
             if len(words) >= 2:
@@ -137,7 +301,7 @@ class JanaParser(BaseBankParser):
                 # Format: IMPS REFERENCE PARTYNAME ...
                 start_idx = 1  # Skip "IMPS"
                 # Check if second word is a reference number (mostly digits)
-                if len(words) > 1 and re.match(r'^\d+$', words[1]):
+                if len(words) > 1 and _DIGITS_RE.match(words[1]):
                     start_idx = 2  # Skip "IMPS" and reference
                 
                 # Collect all potential name parts until we hit keywords or patterns like "9999-JFS-HO"
@@ -146,17 +310,17 @@ class JanaParser(BaseBankParser):
                 for i in range(start_idx, len(words)):
                     word = words[i].upper()
                     # Stop at common transaction keywords
-                    if word in ['PAYMENT', 'AGAINST', 'FOR', 'TO', 'FROM', 'REF', 'REFERENCE', 'ID']:
+                    if word in _IMPS_STOPWORDS:
                         end_idx = i
                         break
                     # Stop at patterns like "9999-JFS-HO" (numbers followed by hyphen-separated codes)
-                    if re.match(r'^\d+-', word):
+                    if _NUM_PREFIX_RE.match(word):
                         end_idx = i
                         break
                     # Skip pure numbers, but keep words that might be part of party name
-                    if word and not re.match(r'^\d+$', word) and len(word) >= 2:
+                    if word and not _DIGITS_RE.match(word) and len(word) >= 2:
                         potential_name_parts.append(words[i])  # Use original case
-                    elif re.match(r'^\d+$', word) and len(word) >= 4:
+                    elif _DIGITS_RE.match(word) and len(word) >= 4:
                         # Skip long numbers that are likely references
                         continue
                 
@@ -165,23 +329,33 @@ class JanaParser(BaseBankParser):
                     # This handles cases like "PRIDE ENTE PRIDE ENTERPRIS" by preferring longer matches
                     best_party_name = ""
                     best_length = 0
-                    
+                    name_parts_upper = [w.upper() for w in potential_name_parts]
+
                     # Try single words first
-                    for word in potential_name_parts:
-                        if is_valid_party_name(word) and not any(bank in word.upper() for bank in BANK_KEYWORDS):
+                    for k, word in enumerate(potential_name_parts):
+                        if is_valid_party_name(word) and not BANK_KEYWORDS_RE.search(name_parts_upper[k]):
                             if len(word) > best_length:
                                 best_party_name = word
                                 best_length = len(word)
-                    
-                    # Try all possible combinations (up to 6 words to handle long names like "PRIDE ENTERPRISES")
+
+                    # Try all possible combinations (up to 6 words to handle long names like "PRIDE ENTERPRISES"),
+                    # extending each span incrementally and tracking the
+                    # seen-word set as it grows instead of re-joining and
+                    # re-splitting the combination per pair
                     for i in range(len(potential_name_parts)):
+                        combined = potential_name_parts[i]
+                        combined_upper = name_parts_upper[i]
+                        span_words = 1
+                        seen_words = {name_parts_upper[i]}
                         for j in range(i+1, min(len(potential_name_parts), i+6)):
-                            combined = ' '.join(potential_name_parts[i:j+1])
-                            if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                            combined += ' ' + potential_name_parts[j]
+                            combined_upper += ' ' + name_parts_upper[j]
+                            span_words += 1
+                            seen_words.add(name_parts_upper[j])
+                            if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                                 combined_length = len(combined)
                                 # Check for obvious duplicates/partial matches (e.g., "PRIDE ENTE PRIDE ENTERPRIS")
-                                words_list = combined.upper().split()
-                                has_duplicate = len(words_list) != len(set(words_list))
+                                has_duplicate = span_words != len(seen_words)
                                 
                                 # Prefer longer names, but heavily favor non-duplicates
                                 # This helps prefer "PRIDE ENTERPRIS" over "PRIDE ENTE PRIDE ENTERPRIS"
@@ -199,23 +373,26 @@ class JanaParser(BaseBankParser):
                         party2 = best_party_name
         
         # RTGS Transactions
-        elif 'RTGS' in desc_clean.upper():
-            payment_category = 'RTGS'
+        elif payment_category == 'RTGS':
             # Similar to IMPS format
             parts = split_transaction_description(desc_clean)
+            parts_upper = [p.upper() for p in parts]
             for i in range(1, len(parts)):
                 potential_party = parts[i]
-                if is_valid_party_name(potential_party) and not any(bank in potential_party.upper() for bank in BANK_KEYWORDS):
+                if is_valid_party_name(potential_party) and not BANK_KEYWORDS_RE.search(parts_upper[i]):
                     party1 = potential_party
                     party2 = potential_party
                     break
-            
+
             # Try combining parts
             if not party1 and len(parts) >= 2:
                 for i in range(1, min(len(parts), 5)):
+                    combined = parts[i]
+                    combined_upper = parts_upper[i]
                     for j in range(i+1, min(len(parts), i+3)):
-                        combined = ' '.join(parts[i:j+1])
-                        if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                        combined += ' ' + parts[j]
+                        combined_upper += ' ' + parts_upper[j]
+                        if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                             party1 = combined
                             party2 = combined
                             break
@@ -223,53 +400,50 @@ class JanaParser(BaseBankParser):
                         break
         
         # Internal transfers (jana ca to jana od)
-        elif 'JANA CA TO JANA OD' in desc_clean.upper():
-            if 'CR' in desc_clean.upper():  # Credit to OD account
-                payment_category = 'INTERNAL TRANSFER CREDIT'
-                # Extract company name from description
-                # Format: "jana ca to jana od Cr - 4515020001253844 - AYEKART RETAIL PRIVATE LIMITED"
-                parts = desc_clean.split('-')
-                if len(parts) >= 3:
-                    company_name = parts[-1].strip()
-                    if is_valid_party_name(company_name) and not any(bank in company_name.upper() for bank in BANK_KEYWORDS):
-                        party1 = company_name
-                        party2 = company_name
-                    else:
-                        party1 = "INTERNAL TRANSFER"
-                        party2 = "INTERNAL TRANSFER"
+        elif payment_category == 'INTERNAL TRANSFER CREDIT':
+            # Extract company name from description
+            # Format: "jana ca to jana od Cr - 4515020001253844 - AYEKART RETAIL PRIVATE LIMITED"
+            parts = desc_clean.split('-')
+            if len(parts) >= 3:
+                company_name = parts[-1].strip()
+                if is_valid_party_name(company_name) and not BANK_KEYWORDS_RE.search(company_name.upper()):
+                    party1 = company_name
+                    party2 = company_name
                 else:
                     party1 = "INTERNAL TRANSFER"
                     party2 = "INTERNAL TRANSFER"
-            else:  # Debit from OD account
-                payment_category = 'INTERNAL TRANSFER DEBIT'
+            else:
                 party1 = "INTERNAL TRANSFER"
                 party2 = "INTERNAL TRANSFER"
-        
-        # Cash transactions
-        elif 'CASH' in desc_clean.upper():
-            if 'DEPOSIT' in desc_clean.upper() or 'CR' in desc_clean.upper():
-                payment_category = 'CASH DEPOSIT'
-            else:
-                payment_category = 'CASH WITHDRAWAL'
+
+        elif payment_category == 'INTERNAL TRANSFER DEBIT':
+            party1 = "INTERNAL TRANSFER"
+            party2 = "INTERNAL TRANSFER"
+
+        # Cash transactions carry no party names
+        elif payment_category in ('CASH DEPOSIT', 'CASH WITHDRAWAL'):
             party1 = ""
             party2 = ""
-        
+
         # Cheque transactions
-        elif 'CHQ' in desc_clean.upper() or 'CHEQUE' in desc_clean.upper():
-            payment_category = 'CHEQUE'
+        elif payment_category == 'CHEQUE':
             parts = split_transaction_description(desc_clean)
-            for part in parts:
-                if is_valid_party_name(part) and not any(bank in part.upper() for bank in BANK_KEYWORDS):
+            parts_upper = [p.upper() for p in parts]
+            for i, part in enumerate(parts):
+                if is_valid_party_name(part) and not BANK_KEYWORDS_RE.search(parts_upper[i]):
                     party1 = part
                     party2 = part
                     break
-            
+
             # Try combining parts
             if not party1 and len(parts) >= 2:
                 for i in range(len(parts)):
+                    combined = parts[i]
+                    combined_upper = parts_upper[i]
                     for j in range(i+1, min(len(parts), i+3)):
-                        combined = ' '.join(parts[i:j+1])
-                        if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                        combined += ' ' + parts[j]
+                        combined_upper += ' ' + parts_upper[j]
+                        if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined_upper):
                             party1 = combined
                             party2 = combined
                             break
@@ -278,134 +452,153 @@ class JanaParser(BaseBankParser):
         
         # Other transactions - Try to extract party name from date-bankcode-reference format
         # Format: 20251001 SBIN225274012699 RADNT
-        else:
-            payment_category = 'OTHER TRANSACTION'
+        elif payment_category == 'OTHER TRANSACTION':
             words = desc_clean.split()
-            # Skip date patterns and bank codes, look for party name
+            # Skip leading date patterns (all digits like 20251001) and
+            # bank codes (like SBIN225274012699) to find where the
+            # party name could start
             start_idx = 0
             for i, word in enumerate(words):
-                # Skip date patterns (all digits like 20251001)
-                if re.match(r'^\d{8}$', word):
+                if _DATE8_RE.match(word) or _BANKCODE_RE.match(word.upper()):
                     continue
-                # Skip bank codes (like SBIN225274012699)
-                if re.match(r'^[A-Z]{3,4}\d+$', word.upper()):
-                    continue
-                # Found potential start of party name
                 start_idx = i
                 break
-            
-            # Extract party name from remaining words
+
+            # One walk over the remaining words: filter the candidate
+            # name parts and check each for a valid single-word party
+            # as it is collected. The first valid word wins, and the
+            # parts gathered so far only matter if no word qualifies.
             potential_name_parts = []
+            name_parts_upper = []
             for i in range(start_idx, len(words)):
                 word = words[i]
-                if word and not re.match(r'^\d+$', word) and len(word) >= 3:
-                    potential_name_parts.append(word)
-            
-            # Try to find valid party name
-            for word in potential_name_parts:
-                if (is_valid_party_name(word) and 
-                    word.upper() not in ['OTHER', 'TRANSACTION', 'PAYMENT', 'BANK'] and
-                    not any(bank in word.upper() for bank in BANK_KEYWORDS)):
+                if not word or _DIGITS_RE.match(word) or len(word) < 3:
+                    continue
+                word_upper = word.upper()
+                potential_name_parts.append(word)
+                name_parts_upper.append(word_upper)
+                if (is_valid_party_name(word) and
+                    word_upper not in _GENERIC_WORDS and
+                    not BANK_KEYWORDS_RE.search(word_upper)):
                     party1 = word
                     party2 = word
                     break
-            
+
             # Try combining parts
             if not party1 and potential_name_parts:
                 for i in range(len(potential_name_parts)):
+                    combined = potential_name_parts[i]
+                    combined_upper = name_parts_upper[i]
                     for j in range(i+1, min(len(potential_name_parts), i+4)):
-                        combined = ' '.join(potential_name_parts[i:j+1])
-                        if (is_valid_party_name(combined) and 
-                            combined.upper() not in ['OTHER', 'TRANSACTION', 'PAYMENT', 'BANK'] and
-                            not any(bank in combined.upper() for bank in BANK_KEYWORDS)):
+                        combined += ' ' + potential_name_parts[j]
+                        combined_upper += ' ' + name_parts_upper[j]
+                        if (is_valid_party_name(combined) and
+                            combined_upper not in _GENERIC_WORDS and
+                            not BANK_KEYWORDS_RE.search(combined_upper)):
                             party1 = combined
                             party2 = combined
                             break
                     if party1:
                         break
         
-        # Clean party names
-        party1 = clean_party_name(party1)
-        party2 = clean_party_name(party2)
-        
-        return pd.Series([payment_category, party1, party2])
-    
+        # Clean party names. party2 mirrors party1 for most transaction
+        # types, so skip the second cleaning pass when they match.
+        cleaned1 = clean_party_name(party1)
+        party2 = cleaned1 if party2 == party1 else clean_party_name(party2)
+        party1 = cleaned1
+
+        return party1, party2
+
     def _map_columns(self, columns: list) -> Dict[str, str]:
         """Map column names to standard names"""
         column_mapping = {}
         
         for col in columns:
             col_lower = str(col).lower()
-            for standard_name, patterns in JANA_COLUMN_PATTERNS.items():
-                if any(pattern in col_lower for pattern in patterns):
+            # One precompiled alternation scan per canonical column
+            for standard_name, pattern_re in JANA_COLUMN_RES.items():
+                if pattern_re.search(col_lower):
                     column_mapping[standard_name] = col
                     break
         
         return column_mapping
-    
-    def _process_row(self, row: pd.Series, column_mapping: Dict[str, str]) -> Dict:
-        """Process a single row of data"""
-        # Extract and format dates
+
+    def _resolve_column_positions(self, columns, column_mapping: Dict[str, str]) -> Dict:
+        """Resolve mapped columns to tuple positions
+
+        Done once per file so _process_row indexes the row tuple
+        directly instead of walking the column mapping per row.
+        """
+        col_idx = {col: i for i, col in enumerate(columns)}
+        return {
+            'sn': col_idx.get(column_mapping.get('S.N.')),
+            'transaction_date': col_idx.get(column_mapping.get('Transaction Date')),
+            'value_date': col_idx.get(column_mapping.get('Value Date')),
+            'description': col_idx.get(column_mapping.get('Description')),
+            'amount': col_idx.get(column_mapping.get('Transaction Amount')),
+            'drcr': col_idx.get(column_mapping.get('Dr/Cr')),
+            'balance': col_idx.get(column_mapping.get('Balance')),
+            'ref': col_idx.get(column_mapping.get('Reference No')),
+        }
+
+    def _process_row(self, cols: Dict, payment_category: str, texts: Dict,
+                     dates: Dict, amounts: Dict, dc_split: tuple, pos: int,
+                     party_cache: Dict) -> Dict:
+        """Assemble one output row from the precomputed columns
+
+        payment_category comes precomputed from the vectorized
+        classification pass in process_file; texts, dates and amounts
+        hold the column-wise stripped/formatted/cleaned strings keyed
+        by column position; dc_split holds the vectorized Debit/Credit,
+        withdrawal, and deposit arrays; pos selects this row from all
+        of them. party_cache memoizes party extraction per
+        (description, category) pair across the file's rows.
+        """
+        # Dates were parsed and formatted column-wide in process_file
         transaction_date = ""
         value_date = ""
+
+        if cols['transaction_date'] is not None:
+            transaction_date = dates[cols['transaction_date']][pos]
+
+        if cols['value_date'] is not None:
+            value_date = dates[cols['value_date']][pos]
+
+        # Description and reference were stripped column-wide
+        description = texts[cols['description']][pos]
+
+        # Amount was cleaned column-wide in process_file
+        amount = amounts[cols['amount']][pos] if cols['amount'] is not None else '0'
+
+        # Debit/Credit and the withdrawal/deposit split were derived
+        # column-wide in process_file
+        debit_credit = dc_split[0][pos]
+        withdrawal_amt = dc_split[1][pos]
+        deposit_amt = dc_split[2][pos]
         
-        if 'Transaction Date' in column_mapping:
-            txn_date_str = str(row.get(column_mapping['Transaction Date'], '')).strip()
-            transaction_date = format_date(txn_date_str)
-        
-        if 'Value Date' in column_mapping:
-            val_date_str = str(row.get(column_mapping['Value Date'], '')).strip()
-            value_date = format_date(val_date_str)
-        
-        # Extract description
-        description = str(row.get(column_mapping.get('Description', ''))).strip()
-        
-        # Extract amount and clean it
-        amount_str = str(row.get(column_mapping.get('Transaction Amount', ''))).strip()
-        amount = clean_amount(amount_str)
-        
-        # Determine debit/credit based on Dr/Cr column
-        dr_cr_col = str(row.get(column_mapping.get('Dr/Cr', ''))).strip().upper()
-        if dr_cr_col == 'C':
-            debit_credit = 'Credit'
-            withdrawal_amt = '0'
-            deposit_amt = str(amount)
-        elif dr_cr_col == 'D':
-            debit_credit = 'Debit'
-            withdrawal_amt = str(amount)
-            deposit_amt = '0'
-        else:
-            debit_credit = ''
-            withdrawal_amt = '0'
-            deposit_amt = '0'
-        
-        # Extract balance and clean it
-        balance_str = str(row.get(column_mapping.get('Balance', ''))).strip()
-        balance = clean_amount(balance_str)
-        
-        # Parse payment category and party names from description
-        payment_category, party1, party2 = self.parse_transaction_description(description)
-        
-        # Validate cash transactions based on debit/credit
-        # Credit + Cash = CASH DEPOSIT, Debit + Cash = CASH WITHDRAWAL
-        if 'CASH' in payment_category.upper():
-            if debit_credit == 'Credit':
-                payment_category = 'CASH DEPOSIT'
-            elif debit_credit == 'Debit':
-                payment_category = 'CASH WITHDRAWAL'
+        # Balance was cleaned column-wide in process_file
+        balance = amounts[cols['balance']][pos] if cols['balance'] is not None else '0'
         
-        # Get reference number
-        ref_no = str(row.get(column_mapping.get('Reference No', ''))).strip()
+        # Parse party names from the description, given its category;
+        # repeated descriptions reuse the file-level cache
+        cache_key = (description, payment_category)
+        parties = party_cache.get(cache_key)
+        if parties is None:
+            parties = self._extract_parties(description, payment_category)
+            party_cache[cache_key] = parties
+        party1, party2 = parties
         
+        ref_no = texts[cols['ref']][pos] if cols['ref'] is not None else 'None'
+
         return {
-            'S.N.': str(row.get(column_mapping.get('S.N.', ''))),
+            'S.N.': texts[cols['sn']][pos] if cols['sn'] is not None else 'None',
             'Transaction Date': transaction_date,
             'Value Date': value_date,
             'Description': description,
             'Reference No': ref_no,
             'Withdrawal Amt (INR)': withdrawal_amt,
             'Deposit Amt (INR)': deposit_amt,
-            'Balance (INR)': str(balance),
+            'Balance (INR)': balance,
             'Debit/Credit': debit_credit,
             'Payment Category': payment_category,
             'Party Name1': party1,
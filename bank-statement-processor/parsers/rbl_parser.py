@@ -3,20 +3,39 @@ RBL Bank parser
 """
 
 import pandas as pd
+import numpy as np
 import re
 from typing import Tuple, Dict
 from parsers.base_parser import BaseBankParser
-from config import RBL_COLUMN_PATTERNS, HEADER_ROWS, BANK_KEYWORDS
+from config import RBL_COLUMN_RES, HEADER_ROWS, BANK_KEYWORDS_RE
 from utils import (
-    is_valid_party_name, clean_party_name, clean_amount, 
-    format_date, determine_debit_credit, split_transaction_description, read_excel_file,
-    add_remark_column
+    is_valid_party_name, clean_party_name, clean_amount_column,
+    format_date_column, split_transaction_description, read_excel_file,
+    add_remark_column, find_header_row
 )
 
 
+# Token-shape checks used inside the party-extraction loops; compiled
+# once at import instead of re.match/re.sub with a literal pattern per word
+_DIGITS_RE = re.compile(r'^\d+$')
+_WS_RE = re.compile(r'\s+')
+
+# Word blacklists for the IMPS party-extraction loops; frozensets give
+# hashed membership instead of a list scan per word per row
+_IMPS_SKIP_WORDS = frozenset({'TO', 'BY', 'VIA', 'FOR', 'PAYMENT'})
+_IMPS_KEYWORDS = frozenset({'FROM', 'TO', 'BY', 'VIA'})
+
+
 class RBLParser(BaseBankParser):
     """Parser for RBL Bank statements"""
-    
+
+    # Output schema produced by _process_row
+    OUTPUT_COLUMNS = (
+        'S.N.', 'Transaction Date', 'Value Date', 'Transaction Details',
+        'Withdrawal Amt (INR)', 'Deposit Amt (INR)', 'Balance (INR)',
+        'Debit/Credit', 'Payment Category', 'Party Name1', 'Party Name2'
+    )
+
     def __init__(self):
         super().__init__("RBL Bank")
         self.header_row = HEADER_ROWS["RBL Bank"]
@@ -24,21 +43,16 @@ class RBLParser(BaseBankParser):
     def process_file(self, file_path) -> pd.DataFrame:
         """Process RBL Bank statement file"""
         try:
-            # First, try to find the header row by reading a few rows
-            # Read more rows to find the header
-            df_temp = read_excel_file(file_path, header=None, nrows=35, dtype=str)
-            
-            # Look for the row that contains column headers
-            header_row_idx = None
+            # Read the workbook once; header detection, the data slice,
+            # and the missing-columns fallback all work off this single
+            # frame instead of re-parsing the file per attempt
+            df_raw = read_excel_file(file_path, header=None, dtype=str)
+
+            # Look for the row that contains column headers with one
+            # vectorized keyword scan over the preview instead of a
+            # Python loop per row and cell
             header_keywords = ['transaction date', 'transaction details', 'cheque', 'value date', 'withdrawl', 'deposit', 'balance']
-            
-            for idx in range(min(35, len(df_temp))):
-                row_values = [str(val).lower().strip() for val in df_temp.iloc[idx].values if pd.notna(val)]
-                # Check if this row contains header keywords
-                matches = sum(1 for keyword in header_keywords if any(keyword in val for val in row_values))
-                if matches >= 3:  # Found at least 3 header keywords
-                    header_row_idx = idx
-                    break
+            header_row_idx = find_header_row(df_raw.head(35), header_keywords)
             
             # If header row found, use it; otherwise use the configured header row
             if header_row_idx is not None:
@@ -46,17 +60,23 @@ class RBLParser(BaseBankParser):
             else:
                 actual_header_row = self.header_row
             
-            # Read Excel file with the correct header row
-            df = read_excel_file(file_path, header=actual_header_row, dtype=str)
+            # A workbook shorter than the header row has no data to
+            # slice; report it the same way as an empty result instead
+            # of letting iloc raise an out-of-bounds error
+            if actual_header_row >= len(df_raw):
+                raise ValueError(f"Empty dataframe after reading file. Please check if header row {actual_header_row} is correct.")
+
+            # Slice the data below the header row and take the header
+            # row's values as column names
+            header_values = df_raw.iloc[actual_header_row]
+            df = df_raw.iloc[actual_header_row + 1:].reset_index(drop=True)
+            df.columns = [str(col).strip() for col in header_values]
             df = self.clean_dataframe(df)
             
             # Check if dataframe is empty
             if df.empty:
                 raise ValueError(f"Empty dataframe after reading file. Please check if header row {actual_header_row} is correct.")
             
-            # Clean column names
-            df.columns = [str(col).strip() for col in df.columns]
-            
             # Map columns
             column_mapping = self._map_columns(df.columns)
             
@@ -65,27 +85,24 @@ class RBLParser(BaseBankParser):
             missing_columns = [col for col in required_columns if col not in column_mapping]
             
             if missing_columns:
-                # Try reading without header and manually setting columns
-                df_no_header = read_excel_file(file_path, header=None, skiprows=actual_header_row, dtype=str)
+                # Walk back up from the detected header row looking for
+                # an earlier row whose values map the required columns
+                df_no_header = df_raw.iloc[actual_header_row:].reset_index(drop=True)
                 df_no_header = self.clean_dataframe(df_no_header)
                 
-                # Try to find header row in the skipped data
                 if actual_header_row > 0:
-                    header_df = read_excel_file(file_path, header=None, nrows=actual_header_row+1, dtype=str)
                     for idx in range(actual_header_row, -1, -1):
-                        if idx < len(header_df):
-                            row_values = [str(val).lower().strip() for val in header_df.iloc[idx].values if pd.notna(val)]
-                            matches = sum(1 for keyword in header_keywords if any(keyword in val for val in row_values))
-                            if matches >= 3:
-                                # Set column names from this row
-                                if len(header_df.iloc[idx]) >= len(df_no_header.columns):
-                                    df_no_header.columns = [str(val).strip() for val in header_df.iloc[idx].values[:len(df_no_header.columns)]]
-                                    df = df_no_header
-                                    df.columns = [str(col).strip() for col in df.columns]
-                                    column_mapping = self._map_columns(df.columns)
-                                    missing_columns = [col for col in required_columns if col not in column_mapping]
-                                    if not missing_columns:
-                                        break
+                        row_values = [str(val).lower().strip() for val in df_raw.iloc[idx].values if pd.notna(val)]
+                        matches = sum(1 for keyword in header_keywords if any(keyword in val for val in row_values))
+                        if matches >= 3:
+                            # Set column names from this row
+                            if len(df_raw.iloc[idx]) >= len(df_no_header.columns):
+                                df_no_header.columns = [str(val).strip() for val in df_raw.iloc[idx].values[:len(df_no_header.columns)]]
+                                df = df_no_header
+                                column_mapping = self._map_columns(df.columns)
+                                missing_columns = [col for col in required_columns if col not in column_mapping]
+                                if not missing_columns:
+                                    break
                 
                 if missing_columns:
                     raise ValueError(
@@ -94,35 +111,76 @@ class RBLParser(BaseBankParser):
                         f"Please check if this is an RBL Bank statement file."
                     )
             
-            # Process data
-            processed_data = []
+            # Resolve the mapped columns to tuple positions once so the
+            # row loop can run over plain tuples instead of
+            # materializing a Series per row
+            cols = self._resolve_column_positions(df.columns, column_mapping)
+
+            # Parse and format the date columns and clean the amount
+            # columns in one vectorized pass each instead of a Python
+            # call per cell. The fallback date candidates get the same
+            # treatment so the per-row walk just indexes the results.
+            date_idxs = {cols.get('Transaction Date'), cols.get('Value Date'),
+                         *cols['date_fallbacks']}
+            dates = {
+                idx: format_date_column(df.iloc[:, idx]).tolist()
+                for idx in date_idxs if idx is not None
+            }
+            amounts = {
+                idx: clean_amount_column(df.iloc[:, idx]).tolist()
+                for idx in (cols.get('Withdrawal Amt'), cols.get('Deposit Amt'),
+                            cols.get('Balance'))
+                if idx is not None
+            }
+
+            # Derive Debit/Credit from the cleaned amounts in one
+            # vectorized pass (mirrors determine_debit_credit)
+            n_rows = len(df)
+            wd_idx = cols.get('Withdrawal Amt')
+            dep_idx = cols.get('Deposit Amt')
+            wd_arr = (np.asarray(amounts[wd_idx], dtype=object) if wd_idx is not None
+                      else np.full(n_rows, '0', dtype=object))
+            dep_arr = (np.asarray(amounts[dep_idx], dtype=object) if dep_idx is not None
+                       else np.full(n_rows, '0', dtype=object))
+            zero = ('', '0', '0.0')
+            dc_split = (
+                np.where(~np.isin(dep_arr, zero), 'Credit',
+                         np.where(~np.isin(wd_arr, zero), 'Debit', '')),
+                wd_arr,
+                dep_arr,
+            )
+
+            # Process data. Accumulate per-column lists instead of a
+            # list of row dicts so pd.DataFrame builds each column in
+            # one shot rather than unifying dtypes row by row.
+            out_columns = {col: [] for col in self.OUTPUT_COLUMNS}
             serial_number = 1
-            for idx, row in df.iterrows():
+            txn_details_idx = cols.get('Transaction Details')
+            # Statements repeat the same transaction detail many times
+            # (recurring merchants, standing transfers), so the scalar
+            # parse runs once per unique string and repeats hit this cache
+            parse_cache = {}
+            for pos, values in enumerate(df.itertuples(index=False, name=None)):
                 # Check if Transaction Details exists and is not empty
-                txn_details_col = column_mapping.get('Transaction Details')
-                if not txn_details_col or pd.isna(row.get(txn_details_col)) or str(row.get(txn_details_col)).strip() == "":
+                if txn_details_idx is None or pd.isna(values[txn_details_idx]) \
+                        or str(values[txn_details_idx]).strip() == "":
                     continue
-                
-                processed_row = self._process_row(serial_number, row, column_mapping)
+
+                processed_row = self._process_row(serial_number, values, cols,
+                                                  dates, amounts, dc_split, pos,
+                                                  parse_cache)
                 if processed_row:
-                    processed_data.append(processed_row)
+                    for col, out_values in out_columns.items():
+                        out_values.append(processed_row[col])
                     serial_number += 1
-            
-            if not processed_data:
+
+            if serial_number == 1:
                 raise ValueError(
                     f"No transaction data found. Please check if the file contains transaction rows. "
                     f"Found columns: {list(df.columns)}"
                 )
-            
-            df = pd.DataFrame(processed_data)
-            
-            # Keep only essential columns
-            essential_cols = [
-                'S.N.', 'Transaction Date', 'Value Date', 'Transaction Details',
-                'Withdrawal Amt (INR)', 'Deposit Amt (INR)', 'Balance (INR)', 'Debit/Credit', 
-                'Payment Category', 'Party Name1', 'Party Name2'
-            ]
-            df = df[[col for col in essential_cols if col in df.columns]]
+
+            df = pd.DataFrame(out_columns)
             
             # Add Remark column using strict rule-based classification
             df = add_remark_column(df, "Transaction Details", "Payment Category")
@@ -132,19 +190,20 @@ class RBLParser(BaseBankParser):
         except Exception as e:
             raise Exception(f"Error processing RBL Bank statement: {e}")
     
-    def parse_transaction_description(self, transaction_details: str) -> pd.Series:
+    def parse_transaction_description(self, transaction_details: str) -> Tuple[str, str, str]:
         """Parse RBL Bank transaction details"""
         if pd.isna(transaction_details) or transaction_details.strip() == "":
-            return pd.Series(["", "", ""])
+            return "", "", ""
         
         details_clean = transaction_details.strip()
+        details_upper = details_clean.upper()
         payment_category = ""
         party1 = ""
         party2 = ""
         
         # Handle IMPS transactions that don't use "/" separator (e.g., "IMPS 529010219903 FROM SCOOTSY LOGISTICS PVT")
         # Check this FIRST before splitting by "/"
-        if 'IMPS' in details_clean.upper() and '/' not in details_clean:
+        if 'IMPS' in details_upper and '/' not in details_clean:
             payment_category = 'IMPS'
             # Split by spaces for IMPS transactions without "/"
             words = details_clean.split()
@@ -163,7 +222,7 @@ class RBLParser(BaseBankParser):
                 for i in range(from_idx, len(words)):
                     word = words[i]
                     # Skip reference numbers (all digits) and common transaction keywords
-                    if not re.match(r'^\d+$', word) and word.upper() not in ['TO', 'BY', 'VIA', 'FOR', 'PAYMENT']:
+                    if not _DIGITS_RE.match(word) and word.upper() not in _IMPS_SKIP_WORDS:
                         party_parts.append(word)
                 
                 # Use the complete party name if we collected parts
@@ -173,38 +232,41 @@ class RBLParser(BaseBankParser):
                     if len(combined) >= 4 and any(c.isalpha() for c in combined):
                         # Check if it's not just a bank keyword
                         combined_upper = combined.upper()
-                        if not any(bank in combined_upper for bank in BANK_KEYWORDS):
+                        if not BANK_KEYWORDS_RE.search(combined_upper):
                             party1 = combined
                             party2 = combined
             else:
                 # No "FROM" keyword, try to extract from words after IMPS and reference number
                 start_idx = 1  # Skip "IMPS"
                 # Check if second word is a reference number (all digits)
-                if len(words) > 1 and re.match(r'^\d+$', words[1]):
+                if len(words) > 1 and _DIGITS_RE.match(words[1]):
                     start_idx = 2  # Skip "IMPS" and reference
                 
-                # Collect potential party name parts
+                # Collect potential party name parts, growing the
+                # joined candidate incrementally instead of re-joining
+                # the whole list on every extension
                 party_parts = []
+                combined = ""
                 for i in range(start_idx, len(words)):
                     word = words[i]
                     # Skip common keywords and reference numbers
-                    if word.upper() not in ['FROM', 'TO', 'BY', 'VIA'] and not re.match(r'^\d+$', word):
+                    if word.upper() not in _IMPS_KEYWORDS and not _DIGITS_RE.match(word):
                         party_parts.append(word)
+                        combined = word if not combined else combined + ' ' + word
                         # Try validating as we build
-                        combined = ' '.join(party_parts)
-                        if is_valid_party_name(combined) and not any(bank in combined.upper() for bank in BANK_KEYWORDS):
+                        if is_valid_party_name(combined) and not BANK_KEYWORDS_RE.search(combined.upper()):
                             party1 = combined
                             party2 = combined
                             break
                 
                 # If we collected parts but didn't validate with strict check, use them anyway if reasonable
                 if not party1 and party_parts:
-                    combined = ' '.join(party_parts)
+                    # combined already holds the full joined candidate
                     # More lenient check - just ensure it has letters and reasonable length
                     if len(combined) >= 4 and any(c.isalpha() for c in combined):
                         # Check if it's not just a bank keyword
                         combined_upper = combined.upper()
-                        if not any(bank in combined_upper for bank in BANK_KEYWORDS):
+                        if not BANK_KEYWORDS_RE.search(combined_upper):
                             party1 = combined
                             party2 = combined
             
@@ -317,8 +379,8 @@ class RBLParser(BaseBankParser):
                     party2 = "IMPS TRANSFER"
             
             # Cash transactions
-            elif 'CASH' in details_clean.upper():
-                if 'DEPOSIT' in details_clean.upper():
+            elif 'CASH' in details_upper:
+                if 'DEPOSIT' in details_upper:
                     payment_category = 'CASH DEPOSIT'
                 else:
                     payment_category = 'CASH WITHDRAWAL'
@@ -326,7 +388,7 @@ class RBLParser(BaseBankParser):
                 party2 = "CASH TRANSACTION"
             
             # Cheque transactions
-            elif 'CHQ' in details_clean.upper() or 'CHEQUE' in details_clean.upper():
+            elif 'CHQ' in details_upper or 'CHEQUE' in details_upper:
                 payment_category = 'CHEQUE'
                 party1 = "CHEQUE TRANSACTION"
                 party2 = "CHEQUE TRANSACTION"
@@ -348,23 +410,27 @@ class RBLParser(BaseBankParser):
         # Only clean if we have a valid party name to avoid losing information
         if party1 and party1 != "IMPS TRANSFER" and party1 != "NEFT TRANSFER" and party1 != "RTGS TRANSFER" and party1 != "CMS TRANSACTION":
             # For IMPS transactions with "FROM" keyword, preserve the full name including suffixes
-            if payment_category == 'IMPS' and 'FROM' in details_clean.upper():
+            if payment_category == 'IMPS' and 'FROM' in details_upper:
                 # Only do light cleaning - remove extra spaces and special chars, but keep company suffixes
                 party1 = party1.strip()
                 party2 = party2.strip()
                 # Remove extra spaces
-                party1 = re.sub(r'\s+', ' ', party1).strip()
-                party2 = re.sub(r'\s+', ' ', party2).strip()
+                party1 = _WS_RE.sub(' ', party1).strip()
+                party2 = _WS_RE.sub(' ', party2).strip()
             else:
-                # For other transactions, use standard cleaning
-                party1 = clean_party_name(party1)
-                party2 = clean_party_name(party2)
+                # For other transactions, use standard cleaning.
+                # party2 mirrors party1, so clean it only when it
+                # actually differs.
+                cleaned1 = clean_party_name(party1)
+                party2 = cleaned1 if party2 == party1 else clean_party_name(party2)
+                party1 = cleaned1
         else:
             # For fallback names, use standard cleaning
-            party1 = clean_party_name(party1)
-            party2 = clean_party_name(party2)
+            cleaned1 = clean_party_name(party1)
+            party2 = cleaned1 if party2 == party1 else clean_party_name(party2)
+            party1 = cleaned1
         
-        return pd.Series([payment_category, party1, party2])
+        return payment_category, party1, party2
     
     def _map_columns(self, columns: list) -> Dict[str, str]:
         """Map column names to standard names"""
@@ -372,112 +438,110 @@ class RBLParser(BaseBankParser):
         
         for col in columns:
             col_lower = str(col).lower().strip()
-            
-            # More flexible matching for each column type
-            if not column_mapping.get('S.N.') and any(pattern in col_lower for pattern in ['s.no', 'sno', 'sl', 'sl.', 'serial']):
-                column_mapping['S.N.'] = col
-            
-            if not column_mapping.get('Transaction Date') and any(pattern in col_lower for pattern in ['transaction date', 'trans date', 'date', 'txn date']):
-                column_mapping['Transaction Date'] = col
-            
-            if not column_mapping.get('Value Date') and any(pattern in col_lower for pattern in ['value date', 'val date']):
-                column_mapping['Value Date'] = col
-            
-            if not column_mapping.get('Transaction Details') and any(pattern in col_lower for pattern in ['transaction details', 'transaction detail', 'particulars', 'description', 'narration', 'details']):
-                column_mapping['Transaction Details'] = col
-            
-            if not column_mapping.get('Withdrawal Amt') and any(pattern in col_lower for pattern in ['withdrawl', 'withdrawal', 'debit', 'dr', 'withdraw']):
-                column_mapping['Withdrawal Amt'] = col
-            
-            if not column_mapping.get('Deposit Amt') and any(pattern in col_lower for pattern in ['deposit', 'credit', 'cr']):
-                column_mapping['Deposit Amt'] = col
-            
-            if not column_mapping.get('Balance') and any(pattern in col_lower for pattern in ['balance', 'bal', 'running balance', 'closing balance']):
-                column_mapping['Balance'] = col
-        
+
+            # One precompiled alternation scan per canonical column. No
+            # break: RBL headers are loose enough that one column can
+            # legitimately satisfy several canonical names.
+            for standard_name, pattern_re in RBL_COLUMN_RES.items():
+                if standard_name not in column_mapping and pattern_re.search(col_lower):
+                    column_mapping[standard_name] = col
+
         return column_mapping
     
-    def _process_row(self, serial_number: int, row: pd.Series, column_mapping: Dict[str, str]) -> Dict:
-        """Process a single row of data"""
-        # Extract and format dates
+    def _resolve_column_positions(self, columns, column_mapping: Dict[str, str]) -> Dict:
+        """Resolve mapped columns to tuple positions
+
+        Done once per file so _process_row indexes the row tuple
+        directly instead of looking names up in the mapping per row.
+        The unmapped-column fallback scans resolve here too: they
+        depend only on the header names, so their result is the same
+        for every row.
+        """
+        col_idx = {col: i for i, col in enumerate(columns)}
+        cols = {name: col_idx.get(col) for name, col in column_mapping.items()}
+
+        lower = [str(col).lower() for col in columns]
+        if cols.get('Withdrawal Amt') is None:
+            cols['Withdrawal Amt'] = next(
+                (i for i, col in enumerate(lower)
+                 if any(term in col for term in ('withdraw', 'debit', 'dr'))), None)
+        if cols.get('Deposit Amt') is None:
+            cols['Deposit Amt'] = next(
+                (i for i, col in enumerate(lower)
+                 if any(term in col for term in ('deposit', 'credit', 'cr'))), None)
+        if cols.get('Balance') is None:
+            cols['Balance'] = next(
+                (i for i, col in enumerate(lower)
+                 if 'balance' in col or 'bal' in col), None)
+
+        # Transaction-date fallback candidates; which one wins is the
+        # first whose value parses, which can vary per row, so only the
+        # candidate list is hoisted
+        cols['date_fallbacks'] = ([i for i, col in enumerate(lower) if 'date' in col]
+                                  if cols.get('Transaction Date') is None else [])
+        return cols
+
+    def _process_row(self, serial_number: int, values: tuple, cols: Dict,
+                     dates: Dict, amounts: Dict, dc_split: tuple, pos: int,
+                     parse_cache: Dict) -> Dict:
+        """Process a single row, delivered as a plain tuple of values
+
+        cols maps standard column names to tuple positions, with the
+        unmapped-column fallbacks already resolved by
+        _resolve_column_positions. dates and amounts hold the
+        column-wise formatted/cleaned strings keyed by column position;
+        dc_split holds the vectorized Debit/Credit, withdrawal, and
+        deposit arrays; pos selects this row from all of them.
+        parse_cache memoizes the parsed (category, party1, party2)
+        triple per unique transaction detail across the file's rows.
+        """
+        # Dates were parsed and formatted column-wide in process_file
         transaction_date = ""
         value_date = ""
-        
-        if 'Transaction Date' in column_mapping:
-            txn_date_str = str(row.get(column_mapping['Transaction Date'], '')).strip()
-            transaction_date = format_date(txn_date_str)
+
+        txn_date_idx = cols.get('Transaction Date')
+        if txn_date_idx is not None:
+            transaction_date = dates[txn_date_idx][pos]
         else:
-            # Try to find date in any column if Transaction Date mapping not found
-            for col in row.index:
-                if 'date' in str(col).lower():
-                    txn_date_str = str(row.get(col, '')).strip()
-                    transaction_date = format_date(txn_date_str)
-                    if transaction_date:
-                        break
-        
-        if 'Value Date' in column_mapping:
-            val_date_str = str(row.get(column_mapping['Value Date'], '')).strip()
-            value_date = format_date(val_date_str)
-        
+            # Try the date-named columns until one parses
+            for i in cols['date_fallbacks']:
+                transaction_date = dates[i][pos]
+                if transaction_date:
+                    break
+
+        val_date_idx = cols.get('Value Date')
+        if val_date_idx is not None:
+            value_date = dates[val_date_idx][pos]
+
         # Skip if no transaction date
         if not transaction_date:
             return None
-        
+
         # Extract transaction details - this is required
-        txn_details_col = column_mapping.get('Transaction Details', '')
-        if not txn_details_col:
+        txn_details_idx = cols.get('Transaction Details')
+        if txn_details_idx is None:
             return None
-        
-        transaction_details = str(row.get(txn_details_col, '')).strip()
+
+        transaction_details = str(values[txn_details_idx]).strip()
         if not transaction_details or transaction_details.lower() in ['nan', 'none', '']:
             return None
+
+        # Amounts were cleaned and Debit/Credit derived column-wide in
+        # process_file
+        debit_credit = dc_split[0][pos]
+        withdrawal_amt = dc_split[1][pos]
+        deposit_amt = dc_split[2][pos]
+
+        balance_idx = cols.get('Balance')
+        balance = amounts[balance_idx][pos] if balance_idx is not None else '0'
         
-        # Extract amounts and determine debit/credit
-        withdrawal_str = ""
-        deposit_str = ""
-        
-        if 'Withdrawal Amt' in column_mapping:
-            withdrawal_str = str(row.get(column_mapping['Withdrawal Amt'], '')).strip()
-        else:
-            # Try to find withdrawal/debit column
-            for col in row.index:
-                col_lower = str(col).lower()
-                if any(term in col_lower for term in ['withdraw', 'debit', 'dr']):
-                    withdrawal_str = str(row.get(col, '')).strip()
-                    break
-        
-        if 'Deposit Amt' in column_mapping:
-            deposit_str = str(row.get(column_mapping['Deposit Amt'], '')).strip()
-        else:
-            # Try to find deposit/credit column
-            for col in row.index:
-                col_lower = str(col).lower()
-                if any(term in col_lower for term in ['deposit', 'credit', 'cr']):
-                    deposit_str = str(row.get(col, '')).strip()
-                    break
-        
-        withdrawal_amt = clean_amount(withdrawal_str)
-        deposit_amt = clean_amount(deposit_str)
-        
-        # Determine debit/credit based on withdrawal/deposit amounts
-        debit_credit = determine_debit_credit(withdrawal_amt, deposit_amt)
-        
-        # Extract balance and clean it
-        balance_str = ""
-        if 'Balance' in column_mapping:
-            balance_str = str(row.get(column_mapping['Balance'], '')).strip()
-        else:
-            # Try to find balance column
-            for col in row.index:
-                col_lower = str(col).lower()
-                if 'balance' in col_lower or 'bal' in col_lower:
-                    balance_str = str(row.get(col, '')).strip()
-                    break
-        
-        balance = clean_amount(balance_str)
-        
-        # Parse payment category and party names from transaction details
-        payment_category, party1, party2 = self.parse_transaction_description(transaction_details)
+        # Parse payment category and party names from transaction
+        # details; repeated details reuse the file-level cache
+        parsed = parse_cache.get(transaction_details)
+        if parsed is None:
+            parsed = self.parse_transaction_description(transaction_details)
+            parse_cache[transaction_details] = parsed
+        payment_category, party1, party2 = parsed
         
         # Validate cash transactions based on debit/credit
         # Credit + Cash = CASH DEPOSIT, Debit + Cash = CASH WITHDRAWAL
@@ -3,57 +3,226 @@ Utility functions for bank statement processing
 """
 
 import pandas as pd
+import numpy as np
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 import os
 
+from config import TRANSACTION_TYPES, UNWANTED_TERMS, MONTHS, SCRUB_RE
+
+# python-calamine (Rust-based Excel parser, roughly 2x openpyxl) is
+# optional; reads fall back to openpyxl when it's not installed
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
+
+def _read_xlsx_streaming(file_path, header=0, skiprows=None, nrows=None,
+                         usecols=None, names=None) -> pd.DataFrame:
+    """
+    Read an .xlsx file by streaming rows through openpyxl's read-only mode.
+
+    Unlike the default pd.read_excel path, this never builds the full
+    workbook object model, so memory stays flat and skipped/unread rows
+    are never materialized. All cell values are returned as strings
+    (matching the dtype=str reads used by the parsers).
+
+    Args:
+        file_path: Path to Excel file or file-like object
+        header: Row index (after skiprows) to use as column names, or None
+        skiprows: Number of leading rows to skip
+        nrows: Maximum number of data rows to read
+        usecols: Iterable of column indices to keep (e.g. range(10))
+        names: Column names to apply when the data width matches; on a
+            width mismatch positional columns are kept so callers can
+            detect and report wrong-format files
+
+    Returns:
+        pd.DataFrame: DataFrame containing the Excel data
+    """
+    import openpyxl
+
+    if hasattr(file_path, 'seek'):
+        file_path.seek(0)
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        # Read-only worksheets can report stale/missing dimensions
+        if ws.max_row is None or ws.max_column is None:
+            ws.reset_dimensions()
+
+        header_values = None
+        rows = []
+        row_iter = ws.iter_rows(values_only=True)
+
+        # Skip leading rows without materializing them
+        for _ in range(skiprows or 0):
+            if next(row_iter, None) is None:
+                break
+
+        if header is not None:
+            for _ in range(header):
+                if next(row_iter, None) is None:
+                    break
+            header_row = next(row_iter, None)
+            if header_row is not None:
+                header_values = list(header_row)
+
+        # Keep only the requested columns as each row streams past, so
+        # stray trailing columns are never accumulated at all. Short
+        # rows are NOT padded to the requested width here: the parsers'
+        # usecols are ascending positions, so dropping the missing
+        # trailing cells keeps the frame at the sheet's true width and
+        # lets wrong-format (too narrow) files fail the checks below.
+        if usecols is not None:
+            usecols = list(usecols)
+
+        for row in row_iter:
+            if usecols is not None:
+                row = [row[i] for i in usecols if i < len(row)]
+            rows.append([str(v) if v is not None else None for v in row])
+            if nrows is not None and len(rows) >= nrows:
+                break
+    finally:
+        wb.close()
+
+    if usecols is not None and header_values is not None:
+        header_values = [header_values[i] if i < len(header_values) else None
+                         for i in usecols]
+
+    if not rows and header_values is None:
+        return pd.DataFrame()
+
+    # Read-only mode can yield ragged rows; pad to a rectangular shape
+    width = max([len(r) for r in rows] + [len(header_values or [])])
+    rows = [r + [None] * (width - len(r)) for r in rows]
+
+    if header_values is not None:
+        header_values = list(header_values) + [None] * (width - len(header_values))
+        columns = [col if col is not None else f"Unnamed: {i}"
+                   for i, col in enumerate(header_values)]
+        return pd.DataFrame(rows, columns=columns)
+
+    # Apply the declared schema straight at read time. width is the
+    # sheet's true (usecols-capped) width, so a too-narrow wrong-format
+    # file falls through to a positional frame of its real column
+    # count and the caller's column-count validation still fires.
+    if names is not None and width == len(names):
+        return pd.DataFrame(rows, columns=list(names))
+
+    return pd.DataFrame(rows)
+
 
 def read_excel_file(file_path, **kwargs) -> pd.DataFrame:
     """
     Read Excel file (.xls or .xlsx) with automatic engine detection
-    
+
+    .xlsx files read with dtype=str (the common parser path) are streamed
+    through openpyxl's read-only mode, which avoids loading the whole
+    workbook into memory; other reads fall back to pd.read_excel().
+
     Args:
         file_path: Path to Excel file or file-like object
         **kwargs: Additional arguments to pass to pd.read_excel()
-        
+
     Returns:
         pd.DataFrame: DataFrame containing the Excel data
     """
-    # If it's a file-like object (like Streamlit upload), try to detect from name or just try both
+    # Detect old-format .xls files, which need the xlrd engine
+    file_name = None
     if hasattr(file_path, 'name'):
         file_name = file_path.name.lower()
-        if file_name.endswith('.xls') and not file_name.endswith('.xlsx'):
-            # Old format .xls file
-            return pd.read_excel(file_path, engine='xlrd', **kwargs)
-        else:
-            # .xlsx or default to openpyxl
-            return pd.read_excel(file_path, engine='openpyxl', **kwargs)
     elif isinstance(file_path, str):
-        # String path
         file_name = file_path.lower()
+
+    if file_name is not None:
         if file_name.endswith('.xls') and not file_name.endswith('.xlsx'):
             # Old format .xls file
             return pd.read_excel(file_path, engine='xlrd', **kwargs)
-        else:
-            # .xlsx or default to openpyxl
-            return pd.read_excel(file_path, engine='openpyxl', **kwargs)
-    else:
-        # Try default (pandas will auto-detect)
+
+        # .xlsx: prefer the calamine engine when available
+        if _HAS_CALAMINE:
+            return pd.read_excel(file_path, engine='calamine', **kwargs)
+
+        # Otherwise stream through read-only openpyxl when the requested
+        # options are the simple ones the parsers use
+        usecols = kwargs.get('usecols')
+        streamable = (set(kwargs) <= {'header', 'skiprows', 'nrows', 'dtype', 'usecols',
+                                      'names'}
+                      and kwargs.get('dtype') is str
+                      and isinstance(kwargs.get('skiprows', 0), int)
+                      and (usecols is None
+                           or all(isinstance(i, int) for i in usecols)))
+        if streamable:
+            return _read_xlsx_streaming(
+                file_path,
+                header=kwargs.get('header', 0),
+                skiprows=kwargs.get('skiprows'),
+                nrows=kwargs.get('nrows'),
+                usecols=usecols,
+                names=kwargs.get('names')
+            )
+        return pd.read_excel(file_path, engine='openpyxl', **kwargs)
+
+    # Unknown source type: try default (pandas will auto-detect)
+    try:
+        return pd.read_excel(file_path, **kwargs)
+    except Exception:
+        # If default fails, try with xlrd for .xls
         try:
-            return pd.read_excel(file_path, **kwargs)
+            return pd.read_excel(file_path, engine='xlrd', **kwargs)
         except Exception:
-            # If default fails, try with xlrd for .xls
-            try:
-                return pd.read_excel(file_path, engine='xlrd', **kwargs)
-            except Exception:
-                # Last resort: try openpyxl
-                return pd.read_excel(file_path, engine='openpyxl', **kwargs)
+            # Last resort: try openpyxl
+            return pd.read_excel(file_path, engine='openpyxl', **kwargs)
+
+
+def find_header_row(df_temp: pd.DataFrame, header_keywords, min_matches: int = 3) -> Optional[int]:
+    """
+    Locate the header row in a raw (header=None) preview frame.
+
+    Runs one vectorized substring scan per keyword over the lowercased
+    frame and counts, per row, how many keywords appear in any cell.
+    Returns the first row index with at least min_matches hits, matching
+    the first-match-wins semantics of the old per-row loops, or None.
+
+    Args:
+        df_temp: Preview DataFrame read with header=None
+        header_keywords: Lowercase substrings expected in the header row
+        min_matches: Minimum distinct keywords required in a row
 
+    Returns:
+        Optional[int]: Row index of the detected header, or None
+    """
+    if df_temp.empty:
+        return None
+
+    lowered = df_temp.astype('string').apply(lambda col: col.str.lower())
+    keyword_hits = sum(
+        lowered.apply(
+            lambda col, kw=keyword: col.str.contains(kw, na=False, regex=False)
+        ).any(axis=1).astype(int)
+        for keyword in header_keywords
+    )
+
+    candidates = keyword_hits[keyword_hits >= min_matches]
+    if candidates.empty:
+        return None
+    return int(candidates.index[0])
 
+
+@lru_cache(maxsize=65536)
 def is_valid_party_name(name: str) -> bool:
     """
     Check if the name is a valid party name (not a bank code, reference number, etc.)
-    
+
+    Candidate names repeat heavily across rows and across the
+    combination scans in the parsers, so results are memoized on the
+    raw string.
+
     Args:
         name: The name to validate
         
@@ -66,7 +235,7 @@ def is_valid_party_name(name: str) -> bool:
     name_upper = name.upper().strip()
     
     # Skip if it's transaction types
-    if name_upper in ["MMT", "IMPS", "NEFT", "RTGS", "CMS", "TRF", "CLG", "INF", "INFT"]:
+    if name_upper in TRANSACTION_TYPES:
         return False
     
     # Skip if it's single letters or very short codes
@@ -88,16 +257,11 @@ def is_valid_party_name(name: str) -> bool:
         return False
     
     # Skip month names alone
-    months = ['JANUARY', 'FEBRUARY', 'MARCH', 'APRIL', 'MAY', 'JUNE', 'JULY', 
-             'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JAN', 'FEB', 
-             'MAR', 'APR', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
-    if name_upper in months:
+    if name_upper in MONTHS:
         return False
-    
+
     # Skip common unwanted terms
-    unwanted_terms = ["ATTN", "PAYMENT", "PAY", "F", "H", "HDFC", "ICICI", "SBI", "AXIS", "YES", "BANK", 
-                     "BANQUE", "BULD", "BANK", "HDFC BANK", "KOTAK MAHINDRA BANK", "MAHINDRA BANK"]
-    if name_upper in unwanted_terms:
+    if name_upper in UNWANTED_TERMS:
         return False
     
     # Must contain alphabets and be of reasonable length
@@ -107,10 +271,14 @@ def is_valid_party_name(name: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=65536)
 def clean_party_name(name: str) -> str:
     """
     Clean up party name by removing unwanted patterns
-    
+
+    Memoized like is_valid_party_name - the regex scrub chain is the
+    expensive part and the same names recur across a statement.
+
     Args:
         name: The name to clean
         
@@ -136,12 +304,9 @@ def clean_party_name(name: str) -> str:
     # Remove date patterns (17 JULY, 25 DEC, etc.)
     cleaned = re.sub(r'\b\d{1,2}\s+[A-Z]{3,9}\b', '', cleaned, flags=re.IGNORECASE)
     
-    # Remove common bank names and unwanted terms
-    bank_names = ['HDFC', 'ICICI', 'SBI', 'AXIS', 'YES', 'BANK', 'BANQUE', 
-                 'ATTN', 'PAYMENT', 'PAY', 'BULD', 'KOTAK', 'MAHINDRA', 'HDFC BANK',
-                 'KOTAK MAHINDRA BANK', 'MAHINDRA BANK']
-    for bank in bank_names:
-        cleaned = re.sub(r'\b' + bank + r'\b', '', cleaned, flags=re.IGNORECASE)
+    # Remove bank names, transaction types and other unwanted terms in
+    # one pass with the precompiled alternation
+    cleaned = SCRUB_RE.sub('', cleaned)
     
     # Clean up extra spaces and special characters
     cleaned = re.sub(r'\s+', ' ', cleaned).strip()
@@ -176,6 +341,23 @@ def clean_amount(amount_str: str) -> str:
     return cleaned if cleaned else "0"
 
 
+def clean_amount_column(amounts: pd.Series) -> pd.Series:
+    """
+    Column-wise counterpart of clean_amount: strip everything except
+    digits and decimal points in one vectorized pass
+
+    Args:
+        amounts: Series of raw amount values
+
+    Returns:
+        pd.Series: Cleaned amount strings, "0" for blank/missing values
+    """
+    # astype(str) keeps missing values missing, so blank them explicitly
+    # before defaulting to "0"
+    cleaned = amounts.astype(str).str.replace(r'[^\d.]', '', regex=True).fillna('')
+    return cleaned.where(cleaned != '', '0')
+
+
 def format_date(date_str: str) -> str:
     """
     Format date string to DD/MM/YYYY format
@@ -195,6 +377,22 @@ def format_date(date_str: str) -> str:
         return ""
 
 
+def format_date_column(dates: pd.Series) -> pd.Series:
+    """
+    Column-wise counterpart of format_date: parse each value
+    independently (format='mixed' mirrors the scalar calls) and render
+    DD/MM/YYYY in one pass
+
+    Args:
+        dates: Series of raw date values
+
+    Returns:
+        pd.Series: Formatted date strings, "" for unparseable values
+    """
+    parsed = pd.to_datetime(dates, errors='coerce', dayfirst=True, format='mixed')
+    return parsed.dt.strftime('%d/%m/%Y').fillna("")
+
+
 def determine_debit_credit(withdrawal_amt: str, deposit_amt: str) -> str:
     """
     Determine if transaction is debit or credit based on amounts
@@ -239,25 +437,42 @@ def determine_debit_credit_from_cr_dr(cr_dr: str) -> str:
         return ""
 
 
-def split_transaction_description(description: str) -> list:
+@lru_cache(maxsize=16384)
+def _split_transaction_description_cached(description: str, maxsplit: int) -> tuple:
+    """Memoized core of split_transaction_description
+
+    Returns a tuple so the cached value is immutable; the public
+    wrapper copies it into the list callers expect.
+    """
+    # Replace hyphens with slashes for uniformity. Stripping each part
+    # and dropping empties already absorbs stray spaces around slashes
+    # and repeated slashes, so one replace + split is all that's needed.
+    parts = str(description).replace("-", "/").split("/", maxsplit)
+    return tuple(stripped for part in parts if (stripped := part.strip()))
+
+
+def split_transaction_description(description: str, maxsplit: int = -1) -> list:
     """
     Split transaction description into parts, handling various separators
-    
+
+    Descriptions repeat heavily within a statement, so the tokenization
+    is memoized on (description, maxsplit).
+
     Args:
         description: Transaction description
-        
+        maxsplit: Cap on the number of splits (str.split semantics);
+            callers that only inspect the leading tokens can pass a
+            small cap to avoid allocating huge lists for noisy
+            descriptions. The final part then carries the unsplit rest,
+            so keep the default for anything that scans trailing tokens.
+
     Returns:
         list: List of description parts
     """
     if pd.isna(description) or description.strip() == "":
         return []
-    
-    # Replace hyphens with slashes for uniformity
-    cleaned = str(description).strip().replace("-", "/")
-    cleaned = cleaned.replace(" /", "/").replace("/ ", "/")
-    cleaned = re.sub(r"/+", "/", cleaned)
-    
-    return [part.strip() for part in cleaned.split('/') if part.strip()]
+
+    return list(_split_transaction_description_cached(description, maxsplit))
 
 
 # ============================================================
@@ -496,39 +711,65 @@ def add_remark_column(df: pd.DataFrame, description_column: str, payment_categor
         # If description column not found, add NA for all rows
         df["Remark"] = "NA"
         return df
-    
-    # Step 1: Collect and match cheque numbers for Cheque Reject classification
-    # This implements cross-row matching: CLG entries matching REJECT entries
-    rejected_cheque_numbers = set()
-    clg_cheque_numbers = {}  # Map cheque_number -> row_index for CLG entries
-    
-    # First pass: Collect CLG cheque numbers
-    for i, val in enumerate(df[description_column].fillna("")):
-        description = str(val)
-        cheque_num = extract_cheque_number_from_clg(description)
-        if cheque_num:
-            clg_cheque_numbers[cheque_num] = i
-    
-    # Second pass: Collect REJECT cheque numbers and match with CLG
-    for i, val in enumerate(df[description_column].fillna("")):
-        description = str(val)
-        cheque_num = extract_cheque_number_from_reject(description)
-        if cheque_num:
-            # Add REJECT cheque number to rejected set
-            rejected_cheque_numbers.add(cheque_num)
-            
-            # Check if this REJECT number matches any CLG entry
-            if cheque_num in clg_cheque_numbers:
-                # Add CLG cheque number to rejected set (both should be marked as Cheque Reject)
-                rejected_cheque_numbers.add(cheque_num)
-    
-    # Step 2: Classify transactions with Remark column (strict priority order)
-    remarks = []
-    for i, val in enumerate(df[description_column].fillna("")):
-        description = str(val)
-        payment_cat = str(df.at[i, payment_category_column]) if payment_category_column in df.columns else ""
-        remark = classify_transaction_remark(description, payment_cat, rejected_cheque_numbers)
-        remarks.append(remark)
-    
-    df["Remark"] = remarks
+
+    # Normalized narration and payment category, computed once for the
+    # whole frame (mirrors normalize_narration)
+    u = df[description_column].fillna("").astype(str).str.upper().str.strip()
+    if payment_category_column in df.columns:
+        pc = df[payment_category_column].fillna("").astype(str).str.upper().str.strip()
+    else:
+        pc = pd.Series("", index=df.index, dtype=object)
+
+    # Step 1: Cross-row cheque matching. Collect the cheque numbers from
+    # REJECT entries, then flag CLG entries carrying the same number
+    # (mirrors extract_cheque_number_from_reject / _from_clg).
+    reject_nums = u.str.extract(r'REJECT[:\s]+(\d+)', expand=False)
+    rejected_cheque_numbers = set(reject_nums.dropna().str.zfill(6))
+
+    clg_nums = u.str.extract(r'^CLG/([^/]*)', expand=False).fillna("")
+    clg_nums = clg_nums.str.replace(r'[^\d]', '', regex=True)
+    clg_rejected = clg_nums.ne("") & clg_nums.str.zfill(6).isin(rejected_cheque_numbers)
+
+    # Step 2: Classify with the same strict priority order as
+    # classify_transaction_remark, as one mask per rule and a single
+    # np.select instead of a Python call per row
+    m_reject = (u.str.contains("REJECT", regex=False)
+                | pc.str.contains("REJECT", regex=False)
+                | clg_rejected)
+
+    m_collections = (u.str.contains("UPI", regex=False)
+                     | pc.str.contains("UPI", regex=False)
+                     | u.str.startswith("BY CASH")
+                     | (u.str.startswith("CAM/") & u.str.contains("CASH DEP", regex=False))
+                     | u.str.startswith("CMS/"))
+
+    m_expense = (u.str.contains("GIB", regex=False)
+                 | u.str.startswith("ACH/")
+                 | u.str.contains("BIL/ONL", regex=False)
+                 | (u.str.contains("BIL", regex=False) & u.str.contains("ONL", regex=False))
+                 | u.str.startswith("EZY/")
+                 | u.str.contains(r'CHQ\s*RTN\s*CHG')
+                 | u.str.contains(r'CHQ\s*RETURN\s*CHG')
+                 | u.str.contains(r'CHEQUE\s*RETURN\s*CHG'))
+
+    m_supplier_kw = (u.str.contains("DABUR", regex=False)
+                     | u.str.contains("LIMITED", regex=False)
+                     | u.str.contains("PVT LTD", regex=False))
+    m_supplier_excl = (u.str.startswith("CMS/")
+                       | u.str.startswith("CAM/")
+                       | u.str.startswith("ACH/")
+                       | u.str.startswith("EZY/")
+                       | u.str.contains("UPI", regex=False)
+                       | u.str.startswith("BY CASH")
+                       | u.str.contains("GIB", regex=False)
+                       | u.str.contains("BIL/ONL", regex=False))
+    m_supplier = (u.str.contains("DD/CC ISSUED", regex=False)
+                  | u.str.contains("DD ISSUED", regex=False)
+                  | (m_supplier_kw & ~m_supplier_excl))
+
+    df["Remark"] = np.select(
+        [u.eq(""), m_reject, m_collections, m_expense, m_supplier],
+        ["NA", "Cheque Reject", "Collections", "Expense", "Supplier Payment"],
+        default="NA"
+    )
     return df